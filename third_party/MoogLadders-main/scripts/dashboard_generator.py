@@ -6,20 +6,30 @@ Generates an interactive HTML dashboard from filter verification results.
 Can be used standalone or imported by filter_verification.py.
 
 Usage:
-    python dashboard_generator.py filter_validation/2026-01-24_194311
-    python dashboard_generator.py filter_validation/2026-01-24_194311 -o custom_dashboard.html
+    python dashboard_generator.py filter_validation/3f9a1c2b7d4e
+    python dashboard_generator.py filter_validation/3f9a1c2b7d4e -o custom_dashboard.html
 """
 
-import argparse
+from __future__ import annotations
+
+import base64
+import gzip
 import json
+import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-import numpy as np
+if TYPE_CHECKING:
+    import numpy as np
 
-# Lazy imports for optional dependencies
+# Lazy imports for optional dependencies (numpy is imported inside the
+# functions that use it so `--help` and plain imports stay fast)
 _scipy_wavfile = None
+_scipy_fft = None
+_orjson = None
 
 
 def _get_wavfile():
@@ -31,6 +41,54 @@ def _get_wavfile():
     return _scipy_wavfile
 
 
+def _get_fft():
+    """Lazy import for scipy.fft."""
+    global _scipy_fft
+    if _scipy_fft is None:
+        from scipy import fft as sfft
+        _scipy_fft = sfft
+    return _scipy_fft
+
+
+def _get_orjson():
+    """Lazy import for orjson (returns None if not installed)."""
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson
+        except ImportError:
+            orjson = False
+        _orjson = orjson
+    return _orjson or None
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Frequency response traces are resampled onto a log-spaced grid matching
+# the dashboard's log x-axis (20 Hz - 20 kHz)
+DASHBOARD_FREQ_MIN_HZ = 20.0
+DASHBOARD_FREQ_MAX_HZ = 20000.0
+DASHBOARD_FREQ_POINTS = 256
+
+# Magnitudes are embedded as fixed-point integers (0.1 dB steps), which is
+# well below what the plot can resolve and keeps the JSON compact
+DASHBOARD_MAG_MIN_DB = -120.0
+DASHBOARD_MAG_MAX_DB = 20.0
+DASHBOARD_MAG_STEP_DB = 0.1
+
+# The summary table only shows the first rows of the results
+DASHBOARD_SUMMARY_ROWS = 100
+
+# Template placeholders look like {{NAME}}
+_PLACEHOLDER_RE = re.compile(r'\{\{(\w+)\}\}')
+
+# Output naming: 'c1000_r0.00_os0/' directories, 'Stilson_c1000_r0.50.wav' files
+_CUTOFF_DIR_RE = re.compile(r'c(\d+)')
+_FILTER_STEM_RE = re.compile(r'(.+?)_c\d')
+
+
 # =============================================================================
 # HTML Template
 # =============================================================================
@@ -41,7 +99,7 @@ DASHBOARD_TEMPLATE = '''<!DOCTYPE html>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>MoogLadders Filter Verification Dashboard</title>
-    <script src="https://cdn.plot.ly/plotly-2.27.0.min.js"></script>
+    <script defer src="https://cdn.plot.ly/plotly-basic-2.27.0.min.js"></script>
     <style>
         :root {
             --bg-primary: #1a1a2e;
@@ -291,21 +349,55 @@ DASHBOARD_TEMPLATE = '''<!DOCTYPE html>
     </div>
 
     <script>
-        // Embedded data from Python
-        const summaryData = {{SUMMARY_JSON}};
-        const freqResponseData = {{FREQ_RESPONSE_JSON}};
+        // Embedded data from Python: gzipped, base64-encoded JSON holding
+        // the frequency responses and the results pre-bucketed per tab
+        const dashboardPayload = "{{DATA_B64}}";
+        const magnitudeStepDb = {{MAG_STEP_DB}};
+        let freqResponseData, thdRows, stepRowsByQ, selfOscRows, summaryRows;
+        let dataLoaded = false;
+
+        async function loadDashboardData() {
+            const bytes = Uint8Array.from(atob(dashboardPayload), c => c.charCodeAt(0));
+            const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+            const data = await new Response(stream).json();
+            freqResponseData = data.freq;
+            thdRows = data.thd;
+            stepRowsByQ = data.step;
+            selfOscRows = data.selfosc;
+            summaryRows = data.summary;
+            dataLoaded = true;
+        }
 
         // Tab switching
+        let activeTab = 'frequency';
+
         function showTab(tabId) {
+            activeTab = tabId;
             document.querySelectorAll('.tab-content').forEach(el => el.classList.remove('active'));
             document.querySelectorAll('.tab').forEach(el => el.classList.remove('active'));
             document.getElementById(tabId).classList.add('active');
             event.target.classList.add('active');
 
-            // Trigger plot resize
-            if (tabId === 'frequency') updateFreqPlot();
-            if (tabId === 'thd') updateThdPlot();
-            if (tabId === 'step') updateStepPlot();
+            renderTab(tabId);
+        }
+
+        // Plot tabs are drawn on first activation, then only resized
+        const tabRenderers = {
+            frequency: [updateFreqPlot, 'freqPlot'],
+            thd: [updateThdPlot, 'thdPlot'],
+            step: [updateStepPlot, 'stepPlot']
+        };
+        const renderedTabs = new Set();
+
+        function renderTab(tabId) {
+            if (!dataLoaded || !tabRenderers[tabId]) return;
+            const [render, plotId] = tabRenderers[tabId];
+            if (renderedTabs.has(tabId)) {
+                Plotly.Plots.resize(plotId);
+                return;
+            }
+            renderedTabs.add(tabId);
+            render();
         }
 
         // Frequency response plot
@@ -326,7 +418,7 @@ DASHBOARD_TEMPLATE = '''<!DOCTYPE html>
                 const data = cutoffData[cutoff];
                 traces.push({
                     x: data.freqs,
-                    y: data.magnitude,
+                    y: data.magnitude.map(q => q * magnitudeStepDb),
                     type: 'scatter',
                     mode: 'lines',
                     name: filterName,
@@ -355,40 +447,60 @@ DASHBOARD_TEMPLATE = '''<!DOCTYPE html>
 
         // THD plot and table
         function updateThdPlot() {
-            const thdResults = summaryData.results.filter(r => r.test_case === 'thd');
             const filterGroups = {};
 
-            thdResults.forEach(r => {
+            thdRows.forEach(r => {
                 if (!filterGroups[r.filter_name]) filterGroups[r.filter_name] = {};
                 filterGroups[r.filter_name][r.metrics.input_level_dbfs] = r.metrics.thd_percent;
             });
 
             const levels = [-18, -12, -6];
-            const traces = [];
             const colors = ['#e94560', '#4ecca3', '#ffc107', '#533483', '#00d9ff',
                            '#ff6b6b', '#95e1d3', '#f38181', '#aa96da', '#fcbad3'];
 
+            // One trace for all filters: null points break the line between
+            // filters, markers carry each filter's color, and the last point
+            // of each segment is labelled in place of a legend
+            const x = [], y = [], pointColors = [], names = [], labels = [];
             let colorIdx = 0;
             for (const [filterName, data] of Object.entries(filterGroups)) {
-                traces.push({
-                    x: levels,
-                    y: levels.map(l => data[l] || 0),
-                    type: 'scatter',
-                    mode: 'lines+markers',
-                    name: filterName,
-                    line: { color: colors[colorIdx % colors.length], width: 2 }
+                const color = colors[colorIdx % colors.length];
+                levels.forEach((l, i) => {
+                    x.push(l);
+                    y.push(data[l] || 0);
+                    pointColors.push(color);
+                    names.push(filterName);
+                    labels.push(i === levels.length - 1 ? filterName : '');
                 });
+                x.push(null);
+                y.push(null);
+                pointColors.push(color);
+                names.push('');
+                labels.push('');
                 colorIdx++;
             }
 
+            const traces = [{
+                x: x,
+                y: y,
+                type: 'scatter',
+                mode: 'lines+markers+text',
+                text: labels,
+                textposition: 'middle right',
+                hovertext: names,
+                hovertemplate: '%{hovertext}: %{y:.4f}%<extra></extra>',
+                line: { color: '#a0a0a0', width: 1 },
+                marker: { color: pointColors, size: 8 }
+            }];
+
             const layout = {
                 title: 'THD vs Input Level',
-                xaxis: { title: 'Input Level (dBFS)', gridcolor: '#333', color: '#eaeaea' },
+                xaxis: { title: 'Input Level (dBFS)', range: [-19, -2], gridcolor: '#333', color: '#eaeaea' },
                 yaxis: { title: 'THD (%)', type: 'log', gridcolor: '#333', color: '#eaeaea' },
                 paper_bgcolor: '#16213e',
                 plot_bgcolor: '#1a1a2e',
                 font: { color: '#eaeaea' },
-                legend: { orientation: 'h', y: -0.2 }
+                showlegend: false
             };
 
             Plotly.newPlot('thdPlot', traces, layout, {responsive: true});
@@ -410,31 +522,32 @@ DASHBOARD_TEMPLATE = '''<!DOCTYPE html>
                 tbody.appendChild(row);
             });
 
-            // Update lowest THD card
-            const lowestThd = Math.min(...Object.values(filterGroups).map(d => d[-18] || 999));
+        }
+
+        // Lowest THD card (header, so filled without drawing the THD tab)
+        function updateLowestThd() {
+            const thd18 = thdRows
+                .filter(r => r.metrics.input_level_dbfs === -18)
+                .map(r => r.metrics.thd_percent || 999);
+            const lowestThd = Math.min(...thd18);
             document.getElementById('lowestThd').textContent = lowestThd.toFixed(4) + '%';
         }
 
         // Step response plot
         function updateStepPlot() {
             const resonance = parseFloat(document.getElementById('stepResonanceSelect').value);
-            const stepResults = summaryData.results.filter(
-                r => r.test_case === 'step' && Math.abs(r.resonance - resonance) < 0.01
-            );
+            const stepResults = stepRowsByQ[resonance.toFixed(2)] || [];
 
-            const traces = [];
             const colors = ['#e94560', '#4ecca3', '#ffc107', '#533483', '#00d9ff',
                            '#ff6b6b', '#95e1d3', '#f38181', '#aa96da', '#fcbad3'];
 
-            stepResults.forEach((r, idx) => {
-                traces.push({
-                    x: [r.filter_name],
-                    y: [r.metrics.overshoot_pct],
-                    type: 'bar',
-                    name: r.filter_name,
-                    marker: { color: colors[idx % colors.length] }
-                });
-            });
+            // One bar trace with a per-bar color array
+            const traces = [{
+                x: stepResults.map(r => r.filter_name),
+                y: stepResults.map(r => r.metrics.overshoot_pct),
+                type: 'bar',
+                marker: { color: stepResults.map((r, idx) => colors[idx % colors.length]) }
+            }];
 
             const layout = {
                 title: `Step Response Overshoot (Q = ${resonance})`,
@@ -452,9 +565,7 @@ DASHBOARD_TEMPLATE = '''<!DOCTYPE html>
             // Update table
             const tbody = document.getElementById('stepTableBody');
             tbody.innerHTML = '';
-            const stepAt09 = summaryData.results.filter(
-                r => r.test_case === 'step' && Math.abs(r.resonance - 0.9) < 0.01
-            );
+            const stepAt09 = (stepRowsByQ['0.90'] || []).slice();
 
             stepAt09.sort((a, b) => a.metrics.overshoot_pct - b.metrics.overshoot_pct)
                 .forEach(r => {
@@ -471,11 +582,10 @@ DASHBOARD_TEMPLATE = '''<!DOCTYPE html>
 
         // Self-oscillation display
         function updateSelfOscillation() {
-            const oscResults = summaryData.results.filter(r => r.test_case === 'selfoscillation');
             const oscillating = new Set();
             const nonOscillating = new Set();
 
-            oscResults.forEach(r => {
+            selfOscRows.forEach(r => {
                 if (r.metrics.oscillating) {
                     oscillating.add(r.filter_name);
                 } else {
@@ -494,7 +604,7 @@ DASHBOARD_TEMPLATE = '''<!DOCTYPE html>
             const tbody = document.getElementById('summaryTableBody');
             tbody.innerHTML = '';
 
-            summaryData.results.slice(0, 100).forEach(r => {
+            summaryRows.forEach(r => {
                 const metrics = Object.entries(r.metrics)
                     .filter(([k, v]) => typeof v === 'number')
                     .map(([k, v]) => `${k}: ${v.toFixed(4)}`)
@@ -513,10 +623,10 @@ DASHBOARD_TEMPLATE = '''<!DOCTYPE html>
         }
 
         // Initialize
-        document.addEventListener('DOMContentLoaded', () => {
-            updateFreqPlot();
-            updateThdPlot();
-            updateStepPlot();
+        document.addEventListener('DOMContentLoaded', async () => {
+            await loadDashboardData();
+            renderTab(activeTab);
+            updateLowestThd();
             updateSelfOscillation();
             updateSummaryTable();
         });
@@ -530,9 +640,10 @@ DASHBOARD_TEMPLATE = '''<!DOCTYPE html>
 # Helper Functions
 # =============================================================================
 
-def linear_to_dbfs(x: np.ndarray) -> np.ndarray:
-    """Convert linear amplitude to dBFS."""
-    return 20 * np.log10(np.abs(x) + 1e-12)
+def complex_to_dbfs(z: np.ndarray) -> np.ndarray:
+    """Convert complex spectrum values to dBFS via |z|^2 (no sqrt pass)."""
+    import numpy as np
+    return 10 * np.log10(z.real * z.real + z.imag * z.imag + 1e-24)
 
 
 def next_power_of_2(n: int) -> int:
@@ -540,22 +651,49 @@ def next_power_of_2(n: int) -> int:
     return 1 << (n - 1).bit_length()
 
 
-def read_wav(path: Path) -> tuple:
+@lru_cache(maxsize=32)
+def _fft_size(n: int) -> int:
+    """Return the zero-padded FFT size used for an n-sample impulse response."""
+    return next_power_of_2(n * 2)
+
+
+@lru_cache(maxsize=32)
+def _hann(n: int) -> np.ndarray:
+    """Return a cached, read-only float32 Hann window of length n."""
+    import numpy as np
+    win = np.hanning(n).astype(np.float32)
+    win.flags.writeable = False
+    return win
+
+
+@lru_cache(maxsize=64)
+def _rfftfreqs(n_fft: int, sample_rate: int) -> np.ndarray:
+    """Return a cached, read-only rFFT frequency axis in Hz."""
+    freqs = _get_fft().rfftfreq(n_fft, 1.0 / sample_rate)
+    freqs.flags.writeable = False
+    return freqs
+
+
+def read_wav(path) -> tuple:
     """Read a WAV file and return normalized float samples.
 
     Args:
-        path: Input file path
+        path: Input file path (str or Path)
 
     Returns:
         Tuple of (samples as float32 in [-1, 1], sample_rate)
     """
+    import numpy as np
+
     wavfile = _get_wavfile()
     sample_rate, data = wavfile.read(str(path))
 
+    # Same scaling as filter_verification.read_wav; integer data is cast and
+    # scaled in a single ufunc pass without an intermediate float copy
     if data.dtype == np.int16:
-        samples = data.astype(np.float32) / 32767.0
+        samples = np.divide(data, np.float32(32767.0), dtype=np.float32)
     elif data.dtype == np.int32:
-        samples = data.astype(np.float32) / 2147483647.0
+        samples = np.divide(data, np.float32(2147483647.0), dtype=np.float32)
     elif data.dtype == np.float32:
         samples = data
     else:
@@ -564,29 +702,235 @@ def read_wav(path: Path) -> tuple:
     return samples, sample_rate
 
 
-def compute_frequency_response(samples: np.ndarray, sample_rate: int) -> tuple:
+def read_wav_blocks(paths: list) -> tuple:
+    """Read impulse responses into one float32 block per (rate, length).
+
+    Args:
+        paths: WAV file paths
+
+    Returns:
+        Tuple of (blocks, errors) where blocks maps (sample_rate, length)
+        to (indices, block) with block[k] holding paths[indices[k]], and
+        errors is a list of (index, exception) tuples
+    """
+    import numpy as np
+
+    errors = []
+    groups = {}
+    for i, path in enumerate(paths):
+        try:
+            samples, sr = read_wav(path)
+        except Exception as e:
+            errors.append((i, e))
+            continue
+        groups.setdefault((sr, len(samples)), []).append((i, samples))
+    blocks = {
+        key: ([i for i, _ in items],
+              np.stack([samples for _, samples in items]).astype(np.float32, copy=False))
+        for key, items in groups.items()
+    }
+    return blocks, errors
+
+
+def compute_frequency_response(
+    samples: np.ndarray,
+    sample_rate: int,
+    need_phase: bool = False
+) -> tuple:
     """Compute frequency response from impulse response.
 
     Args:
         samples: Impulse response samples
         sample_rate: Sample rate in Hz
+        need_phase: Also compute the unwrapped phase
+
+    Returns:
+        Tuple of (frequencies_hz, magnitude_db, phase_rad); phase_rad is None
+        unless need_phase is set
+    """
+    return compute_frequency_response_batch([samples], sample_rate, need_phase=need_phase)[0]
+
+
+def compute_frequency_response_batch(
+    samples_list: list,
+    sample_rate: int,
+    workers: int = -1,
+    need_phase: bool = False
+) -> list:
+    """Compute frequency responses for several impulse responses at once.
+
+    Impulse responses of equal length are stacked into a 2-D array and
+    transformed with a single multi-threaded rFFT call.
+
+    Args:
+        samples_list: Impulse response sample arrays
+        sample_rate: Sample rate in Hz (shared by all inputs)
+        workers: Number of FFT worker threads (-1 for all cores)
+        need_phase: Also compute the unwrapped phase
+
+    Returns:
+        List of (frequencies_hz, magnitude_db, phase_rad) tuples, one per input;
+        phase_rad is None unless need_phase is set
+    """
+    import numpy as np
+
+    responses = [None] * len(samples_list)
+
+    # Bucket by length so each bucket shares one window and FFT size
+    buckets = {}
+    for i, samples in enumerate(samples_list):
+        buckets.setdefault(len(samples), []).append(i)
+
+    for indices in buckets.values():
+        block = np.stack([samples_list[i] for i in indices]).astype(np.float32, copy=False)
+        freqs, magnitude_db, phase_rad = compute_frequency_response_block(
+            block, sample_rate, workers=workers, need_phase=need_phase
+        )
+
+        for row, i in enumerate(indices):
+            responses[i] = (freqs, magnitude_db[row],
+                            phase_rad[row] if need_phase else None)
+
+    return responses
+
+
+def compute_frequency_response_block(
+    block: np.ndarray,
+    sample_rate: int,
+    workers: int = -1,
+    need_phase: bool = False
+) -> tuple:
+    """Compute frequency responses for a 2-D block of equal-length responses.
+
+    The Hann window is applied in place, so block is overwritten.
+
+    Args:
+        block: float32 array of shape (num_responses, length)
+        sample_rate: Sample rate in Hz
+        workers: Number of FFT worker threads (-1 for all cores)
+        need_phase: Also compute the unwrapped phase
 
     Returns:
-        Tuple of (frequencies_hz, magnitude_db, phase_rad)
+        Tuple of (frequencies_hz, magnitude_db, phase_rad) with one row per
+        response; phase_rad is None unless need_phase is set
     """
-    n_fft = next_power_of_2(len(samples) * 2)
-    win = np.hanning(len(samples))
-    windowed = samples * win
+    import numpy as np
+
+    length = block.shape[-1]
+    n_fft = _fft_size(length)
+    block *= _hann(length)
 
-    spectrum = np.fft.rfft(windowed, n=n_fft)
-    freqs = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
+    spectra = _get_fft().rfft(block, n=n_fft, axis=-1, workers=workers)
+    freqs = _rfftfreqs(n_fft, sample_rate)
 
-    magnitude_db = linear_to_dbfs(np.abs(spectrum))
-    phase_rad = np.unwrap(np.angle(spectrum))
+    magnitude_db = complex_to_dbfs(spectra)
+    phase_rad = np.unwrap(np.angle(spectra), axis=-1) if need_phase else None
 
     return freqs, magnitude_db, phase_rad
 
 
+def log_resample(
+    freqs: np.ndarray,
+    magnitude_db: np.ndarray,
+    num_points: int = DASHBOARD_FREQ_POINTS,
+    f_min: float = DASHBOARD_FREQ_MIN_HZ,
+    f_max: float = DASHBOARD_FREQ_MAX_HZ
+) -> tuple:
+    """Resample a magnitude response onto log-spaced frequencies.
+
+    Args:
+        freqs: Linearly spaced frequencies in Hz
+        magnitude_db: Magnitude in dB at each frequency
+        num_points: Number of output points
+        f_min: Lowest output frequency in Hz
+        f_max: Highest output frequency in Hz (clamped to freqs[-1])
+
+    Returns:
+        Tuple of (log_freqs_hz, magnitude_db)
+    """
+    import numpy as np
+
+    log_freqs = np.logspace(np.log10(f_min), np.log10(min(f_max, freqs[-1])), num_points)
+    return log_freqs, np.interp(log_freqs, freqs, magnitude_db)
+
+
+def quantize_magnitude(magnitude_db: np.ndarray) -> np.ndarray:
+    """Quantize a magnitude response to fixed-point dB steps for embedding.
+
+    Args:
+        magnitude_db: Magnitude in dB
+
+    Returns:
+        int16 array in units of DASHBOARD_MAG_STEP_DB
+    """
+    import numpy as np
+
+    clipped = np.clip(magnitude_db, DASHBOARD_MAG_MIN_DB, DASHBOARD_MAG_MAX_DB)
+    return np.round(clipped / DASHBOARD_MAG_STEP_DB).astype(np.int16)
+
+
+def _json_default(obj):
+    """Fallback JSON encoder hook for NumPy values."""
+    import numpy as np
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes, passing NumPy arrays through directly.
+
+    Uses orjson when available (arrays are encoded in C without a tolist()
+    round-trip), otherwise falls back to the standard library.
+
+    Args:
+        obj: Object to serialize (may contain NumPy arrays)
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    orjson = _get_orjson()
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(obj, default=_json_default).encode('utf-8')
+
+
+def encode_payload(obj) -> bytes:
+    """Serialize to JSON, gzip and base64-encode for inline embedding.
+
+    The dashboard decodes the payload with the browser's DecompressionStream.
+
+    Args:
+        obj: Object to serialize (may contain NumPy arrays)
+
+    Returns:
+        Base64-encoded gzip data (ASCII bytes)
+    """
+    # mtime=0 keeps the output reproducible for identical inputs
+    return base64.b64encode(gzip.compress(dumps_json(obj), compresslevel=9, mtime=0))
+
+
+def render_template(template: str, subs: dict) -> bytearray:
+    """Fill {{NAME}} placeholders in a single pass, producing UTF-8 bytes.
+
+    Args:
+        template: Template text
+        subs: Mapping of placeholder name to str or pre-encoded bytes
+
+    Returns:
+        Rendered document as UTF-8 bytes
+    """
+    out = bytearray()
+    # re.split with a capture group alternates literal text and placeholder names
+    for i, part in enumerate(_PLACEHOLDER_RE.split(template)):
+        if i % 2:
+            part = subs[part]
+        out += part if isinstance(part, bytes) else part.encode('utf-8')
+    return out
+
+
 def extract_filter_name(filename: str) -> str:
     """Extract filter name from output filename.
 
@@ -596,7 +940,45 @@ def extract_filter_name(filename: str) -> str:
     Returns:
         Filter name like 'Stilson'
     """
-    return filename.split('_c')[0]
+    m = _FILTER_STEM_RE.match(filename)
+    return m.group(1) if m else filename
+
+
+def _process_wav_group(job: tuple) -> list:
+    """Compute downsampled frequency responses for one cutoff directory.
+
+    Runs in a worker process, so errors are returned rather than raised to
+    keep one bad WAV from aborting the whole pool.
+
+    Args:
+        job: Tuple of (wav_jobs, fft_workers) where wav_jobs is a list of
+            (filter_name, cutoff, wav_path) tuples
+
+    Returns:
+        List of (filter_name, cutoff, wav_path, freqs, magnitude, error) tuples
+    """
+    import numpy as np
+
+    wav_jobs, fft_workers = job
+    blocks, errors = read_wav_blocks([wav_path for _, _, wav_path in wav_jobs])
+    results = [(*wav_jobs[i], None, None, e) for i, e in errors]
+
+    for (sr, _), (indices, block) in blocks.items():
+        try:
+            freqs, magnitude_db, _ = compute_frequency_response_block(
+                block, sr, workers=fft_workers
+            )
+        except Exception as e:
+            results.extend((*wav_jobs[i], None, None, e) for i in indices)
+            continue
+
+        for i, mag_db in zip(indices, magnitude_db):
+            # Log-spaced resample for smaller JSON
+            freqs_ds, mag_ds = log_resample(freqs, mag_db)
+            results.append((*wav_jobs[i], freqs_ds.astype(np.float32),
+                            quantize_magnitude(mag_ds), None))
+
+    return results
 
 
 # =============================================================================
@@ -606,7 +988,8 @@ def extract_filter_name(filename: str) -> str:
 def generate_dashboard(
     run_dir: Path,
     output_path: Optional[Path] = None,
-    verbose: bool = False
+    verbose: bool = False,
+    summary: Optional[Dict[str, Any]] = None
 ) -> Path:
     """Generate an interactive HTML dashboard from test results.
 
@@ -614,21 +997,24 @@ def generate_dashboard(
         run_dir: Path to the test run directory containing metrics/
         output_path: Optional custom output path for the HTML file
         verbose: Print progress messages
+        summary: Summary dict as written to metrics/summary.json, when the
+            caller already has it in memory (default: load it from disk)
 
     Returns:
         Path to the generated HTML file
     """
-    metrics_dir = run_dir / "metrics"
-    summary_path = metrics_dir / "summary.json"
+    if summary is None:
+        metrics_dir = run_dir / "metrics"
+        summary_path = metrics_dir / "summary.json"
 
-    if not summary_path.exists():
-        raise FileNotFoundError(f"Summary file not found: {summary_path}")
+        if not summary_path.exists():
+            raise FileNotFoundError(f"Summary file not found: {summary_path}")
 
-    if verbose:
-        print(f"Loading summary from {summary_path}")
+        if verbose:
+            print(f"Loading summary from {summary_path}")
 
-    with open(summary_path, 'r') as f:
-        summary = json.load(f)
+        with open(summary_path, 'r') as f:
+            summary = json.load(f)
 
     # Generate frequency response data from WAV files
     freq_response_data = {}
@@ -638,39 +1024,75 @@ def generate_dashboard(
         if verbose:
             print("Computing frequency response data for dashboard...")
 
-        for subdir in wav_dir.iterdir():
-            if not subdir.is_dir():
-                continue
-
-            # Parse cutoff from directory name (e.g., 'c1000_r0.00_os0')
-            parts = subdir.name.split('_')
-            cutoff = parts[0][1:]  # e.g., 'c1000' -> '1000'
-
-            for wav_path in subdir.glob("*.wav"):
-                filter_name = extract_filter_name(wav_path.stem)
-
-                if filter_name not in freq_response_data:
-                    freq_response_data[filter_name] = {}
-
-                try:
-                    samples, sr = read_wav(wav_path)
-                    freqs, mag_db, _ = compute_frequency_response(samples, sr)
-
-                    # Downsample for smaller JSON (every 4th point)
-                    freq_response_data[filter_name][cutoff] = {
-                        "freqs": freqs[::4].tolist(),
-                        "magnitude": mag_db[::4].tolist()
-                    }
-                except Exception as e:
-                    if verbose:
-                        print(f"  Warning: Could not process {wav_path}: {e}")
-
-    # Build cutoff and filter options for the HTML
+        # os.scandir reuses the dirent type, avoiding a stat() and a Path
+        # object per entry
+        groups = []
+        with os.scandir(wav_dir) as subdirs:
+            for subdir in subdirs:
+                if not subdir.is_dir(follow_symlinks=False):
+                    continue
+
+                # Parse cutoff from directory name (e.g., 'c1000_r0.00_os0')
+                m = _CUTOFF_DIR_RE.match(subdir.name)
+                if m is None:
+                    continue
+                cutoff = m.group(1)
+
+                wav_jobs = []
+                with os.scandir(subdir.path) as entries:
+                    for entry in entries:
+                        if not (entry.name.endswith('.wav') and entry.is_file()):
+                            continue
+
+                        filter_name = extract_filter_name(entry.name[:-4])
+                        freq_response_data.setdefault(filter_name, {})
+                        wav_jobs.append((filter_name, cutoff, entry.path))
+
+                if wav_jobs:
+                    groups.append(wav_jobs)
+
+        if groups:
+            from concurrent.futures import ProcessPoolExecutor
+
+            # One process per cutoff directory; split the remaining cores
+            # between the FFT threads of each worker
+            cpu_count = os.cpu_count() or 1
+            max_workers = min(len(groups), cpu_count)
+            fft_workers = max(1, cpu_count // max_workers)
+
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                jobs = [(wav_jobs, fft_workers) for wav_jobs in groups]
+                for group_results in executor.map(_process_wav_group, jobs):
+                    for filter_name, cutoff, wav_path, freqs, magnitude, error in group_results:
+                        if error is not None:
+                            if verbose:
+                                print(f"  Warning: Could not process {wav_path}: {error}")
+                            continue
+
+                        freq_response_data[filter_name][cutoff] = {
+                            "freqs": freqs,
+                            "magnitude": magnitude
+                        }
+
+    # Build cutoff and filter options for the HTML, and bucket the results
+    # each tab displays so the page embeds only those rows
+    results = summary.get('results', [])
     cutoffs = set()
     filters = set()
-    for result in summary.get('results', []):
-        if result.get('test_case') == 'linear_response':
+    thd_rows = []
+    step_rows_by_q = {}
+    selfosc_rows = []
+    for result in results:
+        test_case = result.get('test_case')
+        if test_case == 'linear_response':
             cutoffs.add(int(result.get('cutoff_hz', 0)))
+        elif test_case == 'thd':
+            thd_rows.append(result)
+        elif test_case == 'step':
+            q_key = f"{result.get('resonance', 0.0):.2f}"
+            step_rows_by_q.setdefault(q_key, []).append(result)
+        elif test_case == 'selfoscillation':
+            selfosc_rows.append(result)
         filters.add(result.get('filter_name', ''))
 
     cutoff_options = '\n'.join(
@@ -682,26 +1104,33 @@ def generate_dashboard(
         for f in sorted(filters) if f
     )
 
-    # Fill in the template
-    html = DASHBOARD_TEMPLATE
-    html = html.replace('{{RUN_ID}}', summary.get('run_id', 'Unknown'))
-    html = html.replace('{{TIMESTAMP}}', summary.get('timestamp', '')[:19])
-    html = html.replace('{{SAMPLE_RATE}}', str(summary.get('sample_rate', 44100)))
-    html = html.replace('{{NUM_FILTERS}}', str(len(summary.get('filters_tested', []))))
-    html = html.replace('{{NUM_TESTS}}', str(len(summary.get('tests_run', []))))
-    html = html.replace('{{TOTAL_CASES}}', str(summary.get('total_test_cases', 0)))
-    html = html.replace('{{CUTOFF_OPTIONS}}', cutoff_options)
-    html = html.replace('{{FILTER_OPTIONS}}', filter_options)
-    html = html.replace('{{SUMMARY_JSON}}', json.dumps(summary))
-    html = html.replace('{{FREQ_RESPONSE_JSON}}', json.dumps(freq_response_data))
+    # Fill in the template in a single pass
+    subs = {
+        'RUN_ID': summary.get('run_id', 'Unknown'),
+        'TIMESTAMP': summary.get('timestamp', '')[:19],
+        'SAMPLE_RATE': str(summary.get('sample_rate', 44100)),
+        'NUM_FILTERS': str(len(summary.get('filters_tested', []))),
+        'NUM_TESTS': str(len(summary.get('tests_run', []))),
+        'TOTAL_CASES': str(summary.get('total_test_cases', 0)),
+        'CUTOFF_OPTIONS': cutoff_options,
+        'FILTER_OPTIONS': filter_options,
+        'DATA_B64': encode_payload({
+            'freq': freq_response_data,
+            'thd': thd_rows,
+            'step': step_rows_by_q,
+            'selfosc': selfosc_rows,
+            'summary': results[:DASHBOARD_SUMMARY_ROWS],
+        }),
+        'MAG_STEP_DB': str(DASHBOARD_MAG_STEP_DB),
+    }
+    html = render_template(DASHBOARD_TEMPLATE, subs)
 
     # Write output
     if output_path is None:
         output_path = run_dir / "dashboard.html"
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    output_path.write_bytes(html)
 
     if verbose:
         print(f"Dashboard generated: {output_path}")
@@ -715,21 +1144,23 @@ def generate_dashboard(
 
 def main():
     """Command-line interface for standalone dashboard generation."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Generate interactive HTML dashboard from filter verification results.',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-  python dashboard_generator.py filter_validation/2026-01-24_194311
-  python dashboard_generator.py filter_validation/2026-01-24_194311 -o report.html
-  python dashboard_generator.py filter_validation/2026-01-24_194311 --verbose
+  python dashboard_generator.py filter_validation/3f9a1c2b7d4e
+  python dashboard_generator.py filter_validation/3f9a1c2b7d4e -o report.html
+  python dashboard_generator.py filter_validation/3f9a1c2b7d4e --verbose
         """
     )
 
     parser.add_argument(
         'run_dir',
         type=Path,
-        help='Path to the test run directory (e.g., filter_validation/2026-01-24_194311)'
+        help='Path to the test run directory (e.g., filter_validation/3f9a1c2b7d4e)'
     )
 
     parser.add_argument(
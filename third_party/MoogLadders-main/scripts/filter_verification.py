@@ -14,7 +14,9 @@ Usage:
     python filter_verification.py --runfilters build/RunFilters.exe --filters Stilson,Huovilainen
 
 Output:
-    Creates filter_validation/<run_id>/ directory containing:
+    Creates filter_validation/<run_id>/ directory (run_id is a hash of the
+    test configuration, so re-running it overwrites the same directory)
+    containing:
     - inputs/: Generated test signals
     - wav/: RunFilters output WAV files
     - plots/: Analysis PNG plots
@@ -22,20 +24,43 @@ Output:
 """
 
 import argparse
+import contextlib
+import hashlib
+import inspect
+import itertools
 import json
+import os
 import subprocess
 import sys
-from dataclasses import dataclass, field, asdict
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 
 import numpy as np
 
 # Lazy imports for optional heavy dependencies
 _scipy_wavfile = None
 _scipy_signal = None
+_scipy_fft = None
+_pyfftw = None
 _matplotlib_pyplot = None
+_orjson = None
+
+# Cores this process may use for FFT threads; set per test worker so that
+# the workers share the machine instead of each assuming all of it
+_fft_threads = os.cpu_count() or 1
+
+
+def _set_fft_threads(threads: int) -> None:
+    """Set the FFT thread count of this process (scipy.fft and pyFFTW)."""
+    global _fft_threads
+    _fft_threads = threads
+    if _pyfftw:
+        _pyfftw.config.NUM_THREADS = threads
 
 
 def _get_wavfile():
@@ -56,15 +81,74 @@ def _get_signal():
     return _scipy_signal
 
 
+def _get_fft():
+    """Lazy import for scipy.fft."""
+    global _scipy_fft
+    if _scipy_fft is None:
+        from scipy import fft as sfft
+        _scipy_fft = sfft
+    return _scipy_fft
+
+
+def _get_pyfftw():
+    """Lazy import for pyFFTW (returns None if not installed).
+
+    On first use FFTW is set to run on _fft_threads, the scipy.fft interface
+    keeps its plans between calls, and any wisdom saved by an earlier run
+    is loaded.
+    """
+    global _pyfftw
+    if _pyfftw is None:
+        try:
+            import pyfftw
+            import pyfftw.builders
+            import pyfftw.interfaces.scipy_fft
+        except ImportError:
+            _pyfftw = False
+        else:
+            pyfftw.config.NUM_THREADS = _fft_threads
+            pyfftw.interfaces.cache.enable()
+            _load_fftw_wisdom(pyfftw)
+            _pyfftw = pyfftw
+    return _pyfftw or None
+
+
+def _get_orjson():
+    """Lazy import for orjson (returns None if not installed)."""
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson
+        except ImportError:
+            orjson = False
+        _orjson = orjson
+    return _orjson or None
+
+
 def _get_pyplot():
-    """Lazy import for matplotlib.pyplot."""
+    """Lazy import for matplotlib.pyplot (on the non-interactive Agg backend)."""
     global _matplotlib_pyplot
     if _matplotlib_pyplot is None:
+        import matplotlib
+        matplotlib.use('Agg')
         import matplotlib.pyplot as plt
         _matplotlib_pyplot = plt
     return _matplotlib_pyplot
 
 
+def _prewarm_pyplot() -> None:
+    """Start importing pyplot on a daemon thread.
+
+    The ~0.4 s import (matplotlib, font list) then overlaps the first
+    RunFilters runs instead of delaying the first plot. Only for in-process
+    runs: forking pool workers while this thread may hold the import lock
+    can deadlock them.
+    """
+    import threading
+
+    threading.Thread(target=_get_pyplot, daemon=True).start()
+
+
 # =============================================================================
 # Constants
 # =============================================================================
@@ -85,6 +169,9 @@ FILTER_NAMES = [
     "Hyperion",
 ]
 
+# FFTW wisdom persisted between runs when pyFFTW is installed
+FFTW_WISDOM_PATH = Path.home() / ".cache" / "filter_verification" / "fftw_wisdom.json"
+
 # Default parameter grids
 DEFAULT_CUTOFFS = [50, 200, 800, 1000, 2500, 5000, 12000]  # Hz
 DEFAULT_RESONANCES = [0.0, 0.05, 0.1, 0.5, 0.9, 0.95, 1.0]
@@ -128,7 +215,7 @@ class TestCase:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Stores analysis results for a single filter output."""
     filter_name: str
@@ -165,7 +252,30 @@ def linear_to_dbfs(x: np.ndarray) -> np.ndarray:
     Returns:
         Amplitude in dBFS (0 dBFS = full scale)
     """
-    return 20 * np.log10(np.abs(x) + 1e-12)
+    mag = np.abs(x)
+    if isinstance(mag, np.ndarray) and mag.dtype.kind == 'f':
+        # np.abs already returned a fresh buffer; finish the conversion in it
+        return _mag_to_db(mag, out=mag)
+    return 20 * np.log10(mag + 1e-12)
+
+
+def _mag_to_db(mag: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Convert a non-negative magnitude array to dB using one buffer.
+
+    Same result as linear_to_dbfs, but skips np.abs and runs every step in
+    out (pass out=mag to convert a scratch magnitude array in place).
+
+    Args:
+        mag: Non-negative magnitudes
+        out: Optional output buffer (may be mag itself)
+
+    Returns:
+        Magnitude in dB
+    """
+    out = np.add(mag, 1e-12, out=out)
+    np.log10(out, out=out)
+    out *= 20.0
+    return out
 
 
 def dbfs_to_linear(db: float) -> float:
@@ -180,9 +290,13 @@ def dbfs_to_linear(db: float) -> float:
     return 10 ** (db / 20.0)
 
 
-def next_power_of_2(n: int) -> int:
-    """Return the next power of 2 >= n."""
-    return 1 << (n - 1).bit_length()
+def _fft_size(n: int) -> int:
+    """Return the smallest fast real-FFT length >= n.
+
+    pocketfft is efficient for any 2/3/5-smooth size, so this avoids the
+    extra work and memory of zero-padding up to a power of 2.
+    """
+    return _get_fft().next_fast_len(n, real=True)
 
 
 # =============================================================================
@@ -199,9 +313,12 @@ def write_wav(path: Path, samples: np.ndarray, sample_rate: int) -> None:
     """
     wavfile = _get_wavfile()
 
-    # Clip and convert to 16-bit
-    samples_clipped = np.clip(samples, -1.0, 1.0)
-    samples_int16 = (samples_clipped * 32767).astype(np.int16)
+    # Clip into one float32 scratch buffer, scale in place, then round and
+    # cast to 16-bit in a single pass
+    scaled = np.clip(samples, -1.0, 1.0, dtype=np.float32)
+    scaled *= 32767.0
+    samples_int16 = np.empty(scaled.shape, dtype=np.int16)
+    np.rint(scaled, out=samples_int16, casting='unsafe')
 
     path.parent.mkdir(parents=True, exist_ok=True)
     wavfile.write(str(path), sample_rate, samples_int16)
@@ -220,11 +337,12 @@ def read_wav(path: Path) -> Tuple[np.ndarray, int]:
 
     sample_rate, data = wavfile.read(str(path))
 
-    # Convert to float32 normalized
+    # Convert to float32 normalized; integer data is cast and scaled in a
+    # single ufunc pass without an intermediate float copy
     if data.dtype == np.int16:
-        samples = data.astype(np.float32) / 32767.0
+        samples = np.divide(data, np.float32(32767.0), dtype=np.float32)
     elif data.dtype == np.int32:
-        samples = data.astype(np.float32) / 2147483647.0
+        samples = np.divide(data, np.float32(2147483647.0), dtype=np.float32)
     elif data.dtype == np.float32:
         samples = data
     else:
@@ -233,10 +351,57 @@ def read_wav(path: Path) -> Tuple[np.ndarray, int]:
     return samples, sample_rate
 
 
+def write_json(path: Path, obj: Any) -> None:
+    """Write plain JSON data to a file with 2-space indentation.
+
+    Uses orjson when available (encoded in C straight to bytes), otherwise
+    falls back to the standard library.
+
+    Args:
+        path: Output file path
+        obj: JSON-serializable object
+    """
+    orjson = _get_orjson()
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w') as f:
+        json.dump(obj, f, indent=2)
+
+
 # =============================================================================
 # Signal Generation Functions
 # =============================================================================
 
+def _sine_wave(frequency: float, sample_rate: int, num_samples: int) -> np.ndarray:
+    """Return sin(2*pi*frequency*n/sample_rate) for n = 0..num_samples-1.
+
+    Evaluated as a complex rotator in blocks: one block of phasors is rotated
+    by a per-block step, so only about 2*sqrt(N) complex exponentials are
+    computed, no time vector is built, and rounding does not accumulate.
+    Only the imaginary part of each product is formed.
+
+    Args:
+        frequency: Tone frequency in Hz
+        sample_rate: Sample rate in Hz
+        num_samples: Number of samples
+
+    Returns:
+        float32 array of sine samples
+    """
+    omega = 2 * np.pi * frequency / sample_rate
+    block = max(1, int(np.sqrt(num_samples)))
+    num_blocks = -(-num_samples // block)
+
+    phasors = np.exp(1j * omega * np.arange(block)).astype(np.complex64)
+    steps = np.exp(1j * omega * block * np.arange(num_blocks)).astype(np.complex64)
+
+    # Im(step * phasor) = Im(step) * Re(phasor) + Re(step) * Im(phasor)
+    out = np.multiply.outer(steps.imag, phasors.real)
+    out += np.multiply.outer(steps.real, phasors.imag)
+    return out.ravel()[:num_samples]
+
+
 def generate_impulse(
     sample_rate: int = DEFAULT_SAMPLE_RATE,
     length: int = 32768,
@@ -345,10 +510,10 @@ def generate_sine(
         TestSignal containing the sine wave
     """
     num_samples = int(duration * sample_rate)
-    t = np.arange(num_samples, dtype=np.float32) / sample_rate
 
     amplitude = dbfs_to_linear(amplitude_dbfs)
-    samples = amplitude * np.sin(2 * np.pi * frequency * t).astype(np.float32)
+    samples = _sine_wave(frequency, sample_rate, num_samples)
+    samples *= amplitude
 
     return TestSignal(
         name=f"sine_{int(frequency)}hz_{sample_rate}",
@@ -378,11 +543,11 @@ def generate_two_tone(
         TestSignal containing the two-tone signal
     """
     num_samples = int(duration * sample_rate)
-    t = np.arange(num_samples, dtype=np.float32) / sample_rate
 
     amplitude = dbfs_to_linear(amplitude_dbfs)
-    samples = amplitude * (np.sin(2 * np.pi * f1 * t) + np.sin(2 * np.pi * f2 * t))
-    samples = samples.astype(np.float32)
+    samples = _sine_wave(f1, sample_rate, num_samples)
+    samples += _sine_wave(f2, sample_rate, num_samples)
+    samples *= amplitude
 
     return TestSignal(
         name=f"twotone_{int(f1)}_{int(f2)}hz_{sample_rate}",
@@ -409,11 +574,12 @@ def generate_white_noise(
     Returns:
         TestSignal containing white noise
     """
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
     num_samples = int(duration * sample_rate)
 
-    # Generate noise with unit RMS
-    samples = np.random.randn(num_samples).astype(np.float32)
+    # Generate noise with unit RMS straight into a float32 buffer
+    samples = np.empty(num_samples, dtype=np.float32)
+    rng.standard_normal(dtype=np.float32, out=samples)
 
     # Scale to desired RMS level
     rms_linear = dbfs_to_linear(rms_dbfs)
@@ -445,10 +611,10 @@ def generate_near_dc_sine(
         TestSignal containing the low-frequency sine
     """
     num_samples = int(duration * sample_rate)
-    t = np.arange(num_samples, dtype=np.float32) / sample_rate
 
     amplitude = dbfs_to_linear(amplitude_dbfs)
-    samples = amplitude * np.sin(2 * np.pi * frequency * t).astype(np.float32)
+    samples = _sine_wave(frequency, sample_rate, num_samples)
+    samples *= amplitude
 
     return TestSignal(
         name=f"neardc_{int(frequency)}hz_{sample_rate}",
@@ -481,22 +647,42 @@ def generate_silence(
     )
 
 
-def save_test_signal(signal: TestSignal, output_dir: Path) -> Path:
-    """Save a test signal to disk if not already cached.
+def cached_test_signal(
+    generator: Callable[..., TestSignal],
+    output_dir: Path,
+    **params
+) -> Path:
+    """Return the WAV path of a test signal, synthesizing it only on a miss.
+
+    The filename is built from the generator and all of its bound arguments
+    (defaults included), so an existing file is reused only for an identical
+    signal and the generator never runs when it is already on disk.
 
     Args:
-        signal: TestSignal to save
-        output_dir: Directory for output files
+        generator: Signal generator such as generate_sine
+        output_dir: Directory for cached signal files
+        **params: Arguments passed to the generator
 
     Returns:
-        Path to the saved WAV file
+        Path to the WAV file
     """
-    output_path = output_dir / f"{signal.name}.wav"
+    bound = inspect.signature(generator).bind(**params)
+    bound.apply_defaults()
+
+    parts = [generator.__name__.replace("generate_", "", 1)]
+    for value in bound.arguments.values():
+        if value is None:
+            parts.append("auto")
+        elif isinstance(value, (int, float)):
+            parts.append(f"{value:g}")
+        else:
+            parts.append(str(value))
+    output_path = output_dir / f"{'_'.join(parts)}.wav"
 
     if not output_path.exists():
+        signal = generator(**params)
         write_wav(output_path, signal.samples, signal.sample_rate)
 
-    signal.path = output_path
     return output_path
 
 
@@ -504,6 +690,285 @@ def save_test_signal(signal: TestSignal, output_dir: Path) -> Path:
 # Analysis Functions
 # =============================================================================
 
+def _load_fftw_wisdom(pyfftw) -> None:
+    """Import saved FFTW wisdom, ignoring a missing or unreadable file."""
+    try:
+        wisdom = json.loads(FFTW_WISDOM_PATH.read_text())
+        pyfftw.import_wisdom(tuple(w.encode('ascii') for w in wisdom))
+    except (OSError, ValueError, TypeError):
+        pass
+
+
+def _save_fftw_wisdom() -> None:
+    """Persist accumulated FFTW wisdom (no-op without pyFFTW).
+
+    Written through a temporary file and renamed, so worker processes
+    finishing at the same time never leave a partial file.
+    """
+    if not _pyfftw:
+        return
+
+    wisdom = [w.decode('ascii') for w in _pyfftw.export_wisdom()]
+    try:
+        FFTW_WISDOM_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = FFTW_WISDOM_PATH.with_name(f"{FFTW_WISDOM_PATH.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(wisdom))
+        os.replace(tmp_path, FFTW_WISDOM_PATH)
+    except OSError:
+        pass
+
+
+# FFTW plans keyed by (input shape, dtype, n, axis); each owns aligned
+# input/output buffers and is re-executed for every same-shaped transform
+_fftw_plans = {}
+
+
+def _rfft(x: np.ndarray, n: int, axis: int = -1) -> np.ndarray:
+    """Real FFT through a cached pyFFTW plan when installed, else scipy.fft.
+
+    The sweep reuses a handful of transform shapes, so each is planned once
+    with FFTW_MEASURE (against a scratch buffer, since measuring overwrites
+    the input) and later calls only copy into the plan's aligned input.
+
+    Args:
+        x: Real input array
+        n: Transform length (input is zero-padded or truncated)
+        axis: Axis to transform over
+
+    Returns:
+        Complex half spectrum (a new array, not the plan's output buffer)
+    """
+    pyfftw = _get_pyfftw()
+    if pyfftw is None:
+        return _get_fft().rfft(x, n=n, axis=axis, workers=_fft_threads)
+
+    key = (x.shape, x.dtype.str, n, axis)
+    plan = _fftw_plans.get(key)
+    if plan is None:
+        plan = pyfftw.builders.rfft(
+            pyfftw.empty_aligned(x.shape, dtype=x.dtype), n=n, axis=axis,
+            planner_effort='FFTW_MEASURE', threads=pyfftw.config.NUM_THREADS
+        )
+        _fftw_plans[key] = plan
+    return plan(x).copy()
+
+
+def _signal_fft_backend():
+    """Route scipy.signal's internal FFTs through pyFFTW when installed.
+
+    signal.spectrogram and signal.welch call scipy.fft themselves rather
+    than _rfft. The backend is scoped to those calls (not set globally) so
+    that _fft_size keeps scipy's next_fast_len.
+
+    Returns:
+        Context manager to wrap the scipy.signal call in
+    """
+    pyfftw = _get_pyfftw()
+    if pyfftw is None:
+        return contextlib.nullcontext()
+    return _get_fft().set_backend(pyfftw.interfaces.scipy_fft)
+
+
+# Recent magnitude spectra keyed by buffer identity. THD/IMD/self-oscillation
+# analysis and the matching plot transform the same buffer, so the second
+# FFT is a cache hit. Sized to hold one batch of outputs per filter.
+_SPECTRUM_CACHE_SIZE = 32
+_spectrum_cache = OrderedDict()
+
+
+_WINDOW_FUNCTIONS = {
+    "hann": np.hanning,
+    "blackman": np.blackman,
+}
+
+
+@lru_cache(maxsize=32)
+def _window(kind: str, n: int, dtype: type = np.float32) -> np.ndarray:
+    """Return a cached, read-only analysis window of length n.
+
+    float32 by default, so windowing float32 buffers does not promote them
+    (and their FFTs) to double precision.
+
+    Args:
+        kind: "hann" or "blackman"; anything else gives a rectangular window
+        n: Window length
+        dtype: Window dtype
+
+    Returns:
+        Read-only window array
+    """
+    window_function = _WINDOW_FUNCTIONS.get(kind)
+    win = window_function(n) if window_function is not None else np.ones(n)
+    win = win.astype(dtype)
+    win.flags.writeable = False
+    return win
+
+
+@lru_cache(maxsize=32)
+def _rfftfreqs(n_fft: int, sample_rate: int) -> np.ndarray:
+    """Return a cached, read-only rFFT frequency axis in Hz."""
+    freqs = _get_fft().rfftfreq(n_fft, 1.0 / sample_rate)
+    freqs.flags.writeable = False
+    return freqs
+
+
+def _get_spectrum(
+    samples: np.ndarray,
+    sample_rate: int,
+    window: Optional[str] = "hann",
+    n_fft: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute (or fetch from cache) the magnitude spectrum of a buffer.
+
+    Samples must not be modified in place while they may still be cached.
+
+    Args:
+        samples: Audio samples
+        sample_rate: Sample rate in Hz
+        window: "hann", or None for a rectangular window
+        n_fft: FFT size (default: next fast length >= len(samples))
+
+    Returns:
+        Tuple of (magnitude_spectrum, frequencies_hz), both read-only
+    """
+    if n_fft is None:
+        n_fft = _fft_size(len(samples))
+
+    # Each entry holds a reference to its buffer, so the id cannot be reused
+    # by another array while the entry is alive
+    key = (id(samples), n_fft, sample_rate, window)
+    entry = _spectrum_cache.get(key)
+    if entry is not None and entry[0] is samples:
+        _spectrum_cache.move_to_end(key)
+        return entry[1], entry[2]
+
+    spectra, freqs = _get_spectra([samples], sample_rate, window=window, n_fft=n_fft)
+    return spectra[0], freqs
+
+
+def _get_spectra(
+    samples_list: List[np.ndarray],
+    sample_rate: int,
+    window: Optional[str] = "hann",
+    n_fft: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute magnitude spectra of equal-length buffers with one 2-D rFFT.
+
+    Each row is also stored in the spectrum cache, so later _get_spectrum
+    calls on the same buffers (e.g. from the plots) are cache hits. Buffers
+    are stacked and windowed in float32, so scipy.fft runs in single
+    precision (complex64) and the magnitudes stay float32.
+
+    Args:
+        samples_list: Audio sample arrays, all the same length
+        sample_rate: Sample rate in Hz
+        window: "hann", or None for a rectangular window
+        n_fft: FFT size (default: next fast length >= buffer length)
+
+    Returns:
+        Tuple of (spectra, frequencies_hz) where spectra has one row per
+        buffer; both read-only
+    """
+    length = len(samples_list[0])
+    if n_fft is None:
+        n_fft = _fft_size(length)
+
+    # Window (or copy) each buffer straight into a zero-padded float32 block:
+    # one pass per row, and the FFT needs no padding copy of its own
+    block = np.empty((len(samples_list), max(n_fft, length)), dtype=np.float32)
+    block[:, length:] = 0.0
+    win = _window("hann", length) if window == "hann" else None
+    for row, samples in zip(block, samples_list):
+        if win is None:
+            row[:length] = samples
+        else:
+            np.multiply(samples, win, out=row[:length])
+    spectra = np.abs(_rfft(block, n_fft))
+    freqs = _rfftfreqs(n_fft, sample_rate)
+    spectra.flags.writeable = False
+
+    for samples, spectrum in zip(samples_list, spectra):
+        _spectrum_cache[(id(samples), n_fft, sample_rate, window)] = (samples, spectrum, freqs)
+        if len(_spectrum_cache) > _SPECTRUM_CACHE_SIZE:
+            _spectrum_cache.popitem(last=False)
+
+    return spectra, freqs
+
+
+def _length_buckets(arrays: List[np.ndarray]) -> List[List[int]]:
+    """Group array indices by array length, preserving order."""
+    buckets = {}
+    for i, arr in enumerate(arrays):
+        buckets.setdefault(len(arr), []).append(i)
+    return list(buckets.values())
+
+
+def _nearest_bin(freqs: np.ndarray, freq: float) -> int:
+    """Return the index of the bin closest to freq on a sorted axis.
+
+    Binary search instead of argmin over |freqs - freq|; ties go to the
+    lower bin, as argmin would.
+    """
+    idx = int(np.searchsorted(freqs, freq))
+    if idx == len(freqs) or (idx > 0 and freq - freqs[idx - 1] <= freqs[idx] - freq):
+        idx -= 1
+    return idx
+
+
+def _peak_magnitudes(
+    spectrum: np.ndarray,
+    bins: np.ndarray,
+    half_width: int = 2
+) -> np.ndarray:
+    """Return the peak magnitude within +/-half_width bins of each bin.
+
+    All windows are gathered with one fancy-index and reduced in a single
+    max, instead of slicing the spectrum once per bin.
+
+    Args:
+        spectrum: Magnitude spectrum, or a 2-D array with one spectrum per row
+        bins: Center bin indices
+        half_width: Search half-width in bins (allows for drift)
+
+    Returns:
+        float64 array of peak magnitudes with shape spectrum.shape[:-1] +
+        (len(bins),) (0 for bins past the spectrum)
+    """
+    n_bins = spectrum.shape[-1]
+    bins = np.asarray(bins, dtype=np.int64)
+    offsets = np.arange(-half_width, half_width + 1)
+    idx = np.clip(bins[:, None] + offsets[None, :], 0, n_bins - 1)
+    peaks = spectrum[..., idx].max(axis=-1).astype(np.float64)
+    peaks[..., bins >= n_bins] = 0.0
+    return peaks
+
+
+def _unwrap_phase(spectrum: np.ndarray) -> np.ndarray:
+    """Return the unwrapped phase of a complex spectrum.
+
+    Equivalent to np.unwrap(np.angle(spectrum)), but the 2*pi corrections
+    are rounded from the bin-to-bin differences and accumulated in place,
+    avoiding np.unwrap's mod/mask temporaries (about 2x faster).
+
+    Args:
+        spectrum: Complex spectrum
+
+    Returns:
+        Unwrapped phase in radians
+    """
+    phase = np.angle(spectrum)
+
+    # Number of whole turns to remove at each step, accumulated in place
+    turns = np.diff(phase)
+    turns *= -1.0 / (2 * np.pi)
+    np.rint(turns, out=turns)
+    np.cumsum(turns, out=turns)
+    turns *= 2 * np.pi
+
+    phase[1:] += turns
+    return phase
+
+
 def compute_frequency_response(
     samples: np.ndarray,
     sample_rate: int,
@@ -519,28 +984,25 @@ def compute_frequency_response(
     Returns:
         Tuple of (frequencies_hz, magnitude_db, phase_rad)
     """
-    signal = _get_signal()
-
-    # Zero-pad to next power of 2 for FFT efficiency
-    n_fft = next_power_of_2(len(samples) * 2)
+    # pocketfft handles composite sizes efficiently, so transform at the
+    # nearest fast length instead of zero-padding to a power of 2
+    n_fft = _fft_size(len(samples))
 
     # Apply window
-    if window == "hann":
-        win = np.hanning(len(samples))
-    elif window == "blackman":
-        win = np.blackman(len(samples))
-    else:
-        win = np.ones(len(samples))
+    win = _window(window, len(samples), np.float64)
 
-    windowed = samples * win
+    # Kept in float64 (window included): the stopband metrics read values
+    # well below the float32 noise floor (~-140 dB)
+    windowed = samples.astype(np.float64) * win
 
     # Compute FFT
-    spectrum = np.fft.rfft(windowed, n=n_fft)
-    freqs = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
+    spectrum = _rfft(windowed, n_fft)
+    freqs = _rfftfreqs(n_fft, sample_rate)
 
     # Magnitude and phase
-    magnitude_db = linear_to_dbfs(np.abs(spectrum))
-    phase_rad = np.unwrap(np.angle(spectrum))
+    magnitude_db = np.abs(spectrum)
+    _mag_to_db(magnitude_db, out=magnitude_db)
+    phase_rad = _unwrap_phase(spectrum)
 
     return freqs, magnitude_db, phase_rad
 
@@ -553,22 +1015,18 @@ def compute_group_delay(
 
     Args:
         phase_rad: Unwrapped phase in radians
-        freqs: Frequencies in Hz
+        freqs: Equally spaced frequencies in Hz (e.g. from rfftfreq)
 
     Returns:
         Group delay in samples
     """
-    # Group delay = -d(phase)/d(omega)
-    omega = 2 * np.pi * freqs
+    # Group delay = -d(phase)/d(omega); rFFT bins are equally spaced, so
+    # d(omega) is a single nonzero constant
+    d_omega = 2 * np.pi * (freqs[1] - freqs[0])
 
     # Numerical derivative with smoothing
-    d_phase = np.gradient(phase_rad)
-    d_omega = np.gradient(omega)
-
-    # Avoid division by zero
-    d_omega = np.where(np.abs(d_omega) < 1e-10, 1e-10, d_omega)
-
-    group_delay = -d_phase / d_omega
+    group_delay = np.gradient(phase_rad)
+    group_delay *= -1.0 / d_omega
 
     return group_delay
 
@@ -590,41 +1048,60 @@ def compute_thd(
     Returns:
         Tuple of (thd_percent, harmonics_db list)
     """
-    n_fft = next_power_of_2(len(samples))
+    return compute_thd_batch([samples], sample_rate, fundamental_freq, num_harmonics)[0]
+
+
+def compute_thd_batch(
+    samples_list: List[np.ndarray],
+    sample_rate: int,
+    fundamental_freq: float,
+    num_harmonics: int = 10
+) -> List[Tuple[float, List[float]]]:
+    """Compute Total Harmonic Distortion for several outputs at once.
+
+    Buffers of equal length are transformed with one 2-D rFFT and all
+    harmonic peaks are gathered in a single vectorized lookup.
 
-    # Window and FFT
-    win = np.hanning(len(samples))
-    spectrum = np.abs(np.fft.rfft(samples * win, n=n_fft))
-    freqs = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
+    Args:
+        samples_list: Audio sample arrays
+        sample_rate: Sample rate in Hz (shared by all inputs)
+        fundamental_freq: Expected fundamental frequency in Hz
+        num_harmonics: Number of harmonics to include
+
+    Returns:
+        List of (thd_percent, harmonics_db list) tuples, one per input
+    """
+    results = [None] * len(samples_list)
 
-    # Find bin for fundamental
-    fundamental_bin = int(round(fundamental_freq * n_fft / sample_rate))
+    for indices in _length_buckets(samples_list):
+        n_fft = _fft_size(len(samples_list[indices[0]]))
 
-    # Get peak around fundamental (allow ±2 bins for drift)
-    search_range = slice(max(0, fundamental_bin - 2), fundamental_bin + 3)
-    fundamental_power = np.max(spectrum[search_range]) ** 2
+        # Windowed FFTs (shared with the harmonic spectrum plots)
+        spectra, _ = _get_spectra([samples_list[i] for i in indices], sample_rate, n_fft=n_fft)
 
-    # Sum harmonic powers
-    harmonic_power = 0.0
-    harmonics_db = []
+        # Bins for the fundamental and each harmonic; harmonics past the end
+        # of the spectrum are dropped
+        k = np.arange(1, num_harmonics + 1)
+        bins = np.round(fundamental_freq * k * n_fft / sample_rate).astype(np.int64)
+        bins = bins[(k == 1) | (bins < spectra.shape[-1])]
 
-    for k in range(2, num_harmonics + 1):
-        harmonic_bin = int(round(fundamental_freq * k * n_fft / sample_rate))
-        if harmonic_bin >= len(spectrum):
-            break
+        # Peak around each bin (allow ±2 bins for drift)
+        peaks = _peak_magnitudes(spectra, bins)
+        fundamental_power = peaks[:, 0] ** 2
 
-        search_range = slice(max(0, harmonic_bin - 2), harmonic_bin + 3)
-        h_power = np.max(spectrum[search_range]) ** 2
-        harmonic_power += h_power
-        harmonics_db.append(linear_to_dbfs(np.sqrt(h_power)))
+        # Sum harmonic powers
+        harmonic_power = np.sum(peaks[:, 1:] ** 2, axis=1)
+        harmonics_db = linear_to_dbfs(peaks[:, 1:])
 
-    # THD as percentage
-    if fundamental_power > 0:
-        thd_percent = np.sqrt(harmonic_power / fundamental_power) * 100
-    else:
-        thd_percent = 0.0
+        # THD as percentage
+        for row, i in enumerate(indices):
+            if fundamental_power[row] > 0:
+                thd_percent = float(np.sqrt(harmonic_power[row] / fundamental_power[row]) * 100)
+            else:
+                thd_percent = 0.0
+            results[i] = (thd_percent, list(harmonics_db[row]))
 
-    return thd_percent, harmonics_db
+    return results
 
 
 def compute_imd(
@@ -644,24 +1121,26 @@ def compute_imd(
     Returns:
         Tuple of (imd_db, sideband_dict)
     """
-    n_fft = next_power_of_2(len(samples))
+    return compute_imd_batch([samples], sample_rate, f1, f2)[0]
 
-    win = np.hanning(len(samples))
-    spectrum = np.abs(np.fft.rfft(samples * win, n=n_fft))
-    freqs = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
 
-    def get_peak_power(freq: float) -> float:
-        bin_idx = int(round(freq * n_fft / sample_rate))
-        if bin_idx >= len(spectrum):
-            return 0.0
-        search_range = slice(max(0, bin_idx - 2), min(len(spectrum), bin_idx + 3))
-        return np.max(spectrum[search_range]) ** 2
+def compute_imd_batch(
+    samples_list: List[np.ndarray],
+    sample_rate: int,
+    f1: float,
+    f2: float
+) -> List[Tuple[float, Dict[str, float]]]:
+    """Compute Intermodulation Distortion for several outputs at once.
 
-    # Fundamental powers
-    p1 = get_peak_power(f1)
-    p2 = get_peak_power(f2)
-    fundamental_power = p1 + p2
+    Args:
+        samples_list: Audio sample arrays
+        sample_rate: Sample rate in Hz (shared by all inputs)
+        f1: First tone frequency
+        f2: Second tone frequency
 
+    Returns:
+        List of (imd_db, sideband_dict) tuples, one per input
+    """
     # IMD products (2nd and 3rd order)
     imd_products = {
         "f2-f1": abs(f2 - f1),
@@ -671,23 +1150,34 @@ def compute_imd(
         "2f1+f2": 2 * f1 + f2,
         "2f2+f1": 2 * f2 + f1,
     }
+    names = [name for name, freq in imd_products.items() if freq < sample_rate / 2]
+    tone_freqs = np.array([f1, f2] + [imd_products[name] for name in names], dtype=np.float64)
 
-    sideband_db = {}
-    imd_power = 0.0
+    results = [None] * len(samples_list)
 
-    for name, freq in imd_products.items():
-        if freq < sample_rate / 2:
-            power = get_peak_power(freq)
-            imd_power += power
-            sideband_db[name] = linear_to_dbfs(np.sqrt(power))
+    for indices in _length_buckets(samples_list):
+        n_fft = _fft_size(len(samples_list[indices[0]]))
 
-    # IMD as dB relative to fundamentals
-    if fundamental_power > 0:
-        imd_db = linear_to_dbfs(np.sqrt(imd_power / fundamental_power))
-    else:
-        imd_db = -120.0
+        # Windowed FFTs (shared with the IMD spectrum plots)
+        spectra, _ = _get_spectra([samples_list[i] for i in indices], sample_rate, n_fft=n_fft)
+
+        # Peak powers of both tones and all products in one gather
+        bins = np.round(tone_freqs * n_fft / sample_rate).astype(np.int64)
+        powers = _peak_magnitudes(spectra, bins) ** 2
+
+        fundamental_power = powers[:, 0] + powers[:, 1]
+        imd_power = np.sum(powers[:, 2:], axis=1)
+        sideband_db = linear_to_dbfs(np.sqrt(powers[:, 2:]))
 
-    return imd_db, sideband_db
+        # IMD as dB relative to fundamentals
+        for row, i in enumerate(indices):
+            if fundamental_power[row] > 0:
+                imd_db = float(linear_to_dbfs(np.sqrt(imd_power[row] / fundamental_power[row])))
+            else:
+                imd_db = -120.0
+            results[i] = (imd_db, dict(zip(names, sideband_db[row])))
+
+    return results
 
 
 def compute_spectrogram(
@@ -707,17 +1197,81 @@ def compute_spectrogram(
     """
     signal = _get_signal()
 
-    freqs, times, Sxx = signal.spectrogram(
-        samples,
-        fs=sample_rate,
-        nperseg=nperseg,
-        noverlap=nperseg // 2,
-        scaling='spectrum'
-    )
+    with _signal_fft_backend():
+        freqs, times, Sxx = signal.spectrogram(
+            samples,
+            fs=sample_rate,
+            nperseg=nperseg,
+            noverlap=nperseg // 2,
+            scaling='spectrum'
+        )
+
+    # Sxx is a fresh array, so convert it to dB in place instead of
+    # allocating three full-size temporaries
+    Sxx += 1e-12
+    np.log10(Sxx, out=Sxx)
+    Sxx *= 10.0
+
+    return times, freqs, Sxx
+
+
+def compute_linear_metrics(
+    freqs: np.ndarray,
+    mag_db: np.ndarray
+) -> Dict[str, float]:
+    """Compute cutoff, passband ripple and stopband attenuation.
+
+    Args:
+        freqs: Frequency axis in Hz
+        mag_db: Magnitude response in dB
+
+    Returns:
+        Dict with cutoff_measured_hz, passband_ripple_db, stopband_atten_db
+    """
+    # -3 dB point relative to DC, with one temporary for the distance
+    distance = mag_db - mag_db[0]
+    distance += 3
+    np.abs(distance, out=distance)
+    cutoff_measured = freqs[np.argmin(distance)]
+
+    # Passband is the first 10% of bins, stopband the last 40%
+    passband = mag_db[:int(len(mag_db) * 0.1)]
+    stopband = mag_db[int(len(mag_db) * 0.6):]
+
+    return {
+        "cutoff_measured_hz": float(cutoff_measured),
+        "passband_ripple_db": float(np.max(passband) - np.min(passband)),
+        "stopband_atten_db": float(-np.min(stopband)),
+    }
 
-    magnitude_db = 10 * np.log10(Sxx + 1e-12)
 
-    return times, freqs, magnitude_db
+def compute_resonance_peak(
+    freqs: np.ndarray,
+    spec_db: np.ndarray,
+    cutoff: float
+) -> Tuple[float, float]:
+    """Locate the resonance peak of a spectrogram around the cutoff.
+
+    The band (0.5x to 1.5x cutoff) is read as a slice of the sorted
+    frequency axis, so the spectrogram rows are viewed rather than copied.
+
+    Args:
+        freqs: Spectrogram frequency axis in Hz (ascending)
+        spec_db: Spectrogram in dB, one row per frequency
+        cutoff: Filter cutoff in Hz
+
+    Returns:
+        Tuple of (peak_freq_hz, peak_amplitude_db); (cutoff, -80) if no bin
+        falls inside the band
+    """
+    lo = np.searchsorted(freqs, cutoff * 0.5, side='right')
+    hi = np.searchsorted(freqs, cutoff * 1.5, side='left')
+    if hi <= lo:
+        return float(cutoff), -80.0
+
+    band = spec_db[lo:hi]
+    peak_freq_idx = np.argmax(np.mean(band, axis=1))
+    return float(freqs[lo + peak_freq_idx]), float(np.max(band))
 
 
 def compute_step_metrics(
@@ -753,14 +1307,13 @@ def compute_step_metrics(
 
     # Settling time (2% band)
     tolerance = abs(dc_gain) * 0.02
-    settled = np.abs(samples - dc_gain) < tolerance
+    not_settled = np.abs(samples - dc_gain) >= tolerance
 
-    # Find first sample where it stays settled
+    # Find first sample where it stays settled: one past the last unsettled
+    # sample, located by argmax over the reversed mask
     settling_sample = len(samples)
-    for i in range(len(samples) - 1, -1, -1):
-        if not settled[i]:
-            settling_sample = i + 1
-            break
+    if not_settled.any():
+        settling_sample = len(samples) - int(np.argmax(not_settled[::-1]))
 
     settling_time_ms = settling_sample / sample_rate * 1000
 
@@ -801,24 +1354,89 @@ def detect_self_oscillation(
     Returns:
         Dict with oscillating, dominant_freq_hz, rms_dbfs
     """
-    rms_linear, rms_dbfs = compute_rms(samples)
+    return detect_self_oscillation_batch([samples], sample_rate, threshold_dbfs)[0]
 
-    # Check if output has significant energy
-    oscillating = rms_dbfs > threshold_dbfs
 
-    # Find dominant frequency
-    dominant_freq = 0.0
-    if oscillating:
-        n_fft = next_power_of_2(len(samples))
-        spectrum = np.abs(np.fft.rfft(samples, n=n_fft))
-        freqs = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
-        dominant_freq = freqs[np.argmax(spectrum)]
+def detect_self_oscillation_batch(
+    samples_list: List[np.ndarray],
+    sample_rate: int,
+    threshold_dbfs: float = -60.0
+) -> List[Dict[str, Any]]:
+    """Detect self-oscillation in several filter outputs at once.
 
-    return {
-        "oscillating": oscillating,
-        "dominant_freq_hz": float(dominant_freq),
-        "rms_dbfs": float(rms_dbfs),
-    }
+    Equal-length outputs are stacked so the RMS levels come from one
+    reduction and the dominant frequencies from one 2-D rFFT and argmax.
+
+    Args:
+        samples_list: Filter output arrays (should be from silence input)
+        sample_rate: Sample rate in Hz (shared by all inputs)
+        threshold_dbfs: RMS threshold for detecting oscillation
+
+    Returns:
+        List of dicts with oscillating, dominant_freq_hz, rms_dbfs
+    """
+    results = [None] * len(samples_list)
+
+    for indices in _length_buckets(samples_list):
+        block = np.stack([np.asarray(samples_list[i], dtype=np.float32) for i in indices])
+        rms_dbfs = linear_to_dbfs(np.sqrt(np.mean(block ** 2, axis=1)))
+
+        # Unwindowed spectra (shared with the self-oscillation plots)
+        spectra, freqs = _get_spectra([samples_list[i] for i in indices], sample_rate, window=None)
+        dominant_freqs = freqs[np.argmax(spectra, axis=1)]
+
+        for row, i in enumerate(indices):
+            # Check if output has significant energy
+            oscillating = bool(rms_dbfs[row] > threshold_dbfs)
+            results[i] = {
+                "oscillating": oscillating,
+                "dominant_freq_hz": float(dominant_freqs[row]) if oscillating else 0.0,
+                "rms_dbfs": float(rms_dbfs[row]),
+            }
+
+    return results
+
+
+def compute_alias_ratio_batch(
+    samples_list: List[np.ndarray],
+    sample_rate: int,
+    test_freq: float
+) -> List[float]:
+    """Compute alias-to-signal energy ratios for several outputs at once.
+
+    Outputs of one sweep point share their length, so they share one FFT
+    size, one 2-D rFFT and one pair of band ranges.
+
+    Args:
+        samples_list: Audio sample arrays
+        sample_rate: Sample rate in Hz (shared by all inputs)
+        test_freq: Frequency of the test tone in Hz
+
+    Returns:
+        Alias ratio in dB for each input
+    """
+    results = [None] * len(samples_list)
+
+    for indices in _length_buckets(samples_list):
+        # Unwindowed spectra; all rows share the frequency axis
+        spectra, freqs = _get_spectra([samples_list[i] for i in indices], sample_rate, window=None)
+
+        # Bin ranges of the expected band and the alias band (below the
+        # fundamental, excluding DC); freqs is sorted, so each band is a
+        # slice and no boolean masks or gathered copies are needed
+        main_lo, alias_lo = np.searchsorted(freqs, [test_freq * 0.9, 100], side='right')
+        main_hi, alias_hi = np.searchsorted(freqs, [test_freq * 1.1, test_freq * 0.5], side='left')
+
+        # Summed row by row: a 2-D axis=1 reduction changes float32 rounding
+        for spectrum, i in zip(spectra, indices):
+            main_energy = np.sum(spectrum[main_lo:main_hi] ** 2)
+            alias_energy = np.sum(spectrum[alias_lo:alias_hi] ** 2)
+            if main_energy > 0:
+                results[i] = float(10 * np.log10(alias_energy / main_energy + 1e-12))
+            else:
+                results[i] = -120.0
+
+    return results
 
 
 def compute_psd(
@@ -838,7 +1456,8 @@ def compute_psd(
     """
     signal = _get_signal()
 
-    freqs, psd = signal.welch(samples, fs=sample_rate, nperseg=nperseg)
+    with _signal_fft_backend():
+        freqs, psd = signal.welch(samples, fs=sample_rate, nperseg=nperseg)
     psd_db = 10 * np.log10(psd + 1e-12)
 
     return freqs, psd_db
@@ -848,6 +1467,49 @@ def compute_psd(
 # Plot Generation Functions
 # =============================================================================
 
+# Diagnostic plots favour encode speed over file size: zlib level 1 writes
+# noticeably faster than Pillow's default level 6 for ~20% larger PNGs.
+_PNG_PIL_KWARGS = {"compress_level": 1, "optimize": False}
+
+# Figures kept between plots, keyed by (figsize, nrows). Plots of the same
+# shape clear and refill one Figure instead of building a new artist tree
+_figure_pool = {}
+_figure_keys = {}
+
+
+def _acquire_fig(figsize: Tuple[float, float], nrows: int = 1):
+    """Take a cleared figure of the given shape from the pool.
+
+    Args:
+        figsize: Figure size in inches
+        nrows: Number of vertically stacked axes
+
+    Returns:
+        Tuple of (figure, axes) laid out like plt.subplots(nrows, 1)
+    """
+    key = (figsize, nrows)
+    fig = _figure_pool.pop(key, None)
+    if fig is None:
+        fig = _get_pyplot().figure(figsize=figsize)
+        _figure_keys[fig] = key
+    else:
+        fig.clear()
+    return fig, fig.subplots(nrows, 1)
+
+
+def _release_fig(fig) -> None:
+    """Return a saved figure to the pool for the next plot of its shape."""
+    _figure_pool[_figure_keys[fig]] = fig
+
+
+@lru_cache(maxsize=8)
+def _time_ms_axis(num_samples: int, sample_rate: int) -> np.ndarray:
+    """Return a cached, read-only time axis in milliseconds."""
+    time_ms = np.arange(num_samples) / sample_rate * 1000
+    time_ms.flags.writeable = False
+    return time_ms
+
+
 def plot_frequency_response(
     freqs: np.ndarray,
     magnitude_db: np.ndarray,
@@ -867,9 +1529,7 @@ def plot_frequency_response(
     Returns:
         Path to saved PNG
     """
-    plt = _get_pyplot()
-
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = _acquire_fig((10, 6))
 
     ax.semilogx(freqs[1:], magnitude_db[1:], linewidth=1.5)
 
@@ -886,8 +1546,8 @@ def plot_frequency_response(
     ax.legend()
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(str(output_path), dpi=150, bbox_inches='tight')
-    plt.close(fig)
+    fig.savefig(str(output_path), dpi=150, pil_kwargs=_PNG_PIL_KWARGS)
+    _release_fig(fig)
 
     return output_path
 
@@ -909,9 +1569,7 @@ def plot_phase_response(
     Returns:
         Path to saved PNG
     """
-    plt = _get_pyplot()
-
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = _acquire_fig((10, 6))
 
     phase_deg = np.rad2deg(phase_rad)
     ax.semilogx(freqs[1:], phase_deg[1:], linewidth=1.5)
@@ -923,8 +1581,8 @@ def plot_phase_response(
     ax.grid(True, alpha=0.3, which='both')
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(str(output_path), dpi=150, bbox_inches='tight')
-    plt.close(fig)
+    fig.savefig(str(output_path), dpi=150, pil_kwargs=_PNG_PIL_KWARGS)
+    _release_fig(fig)
 
     return output_path
 
@@ -948,9 +1606,7 @@ def plot_group_delay(
     Returns:
         Path to saved PNG
     """
-    plt = _get_pyplot()
-
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = _acquire_fig((10, 6))
 
     # Convert to milliseconds
     group_delay_ms = group_delay / sample_rate * 1000
@@ -964,8 +1620,8 @@ def plot_group_delay(
     ax.grid(True, alpha=0.3, which='both')
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(str(output_path), dpi=150, bbox_inches='tight')
-    plt.close(fig)
+    fig.savefig(str(output_path), dpi=150, pil_kwargs=_PNG_PIL_KWARGS)
+    _release_fig(fig)
 
     return output_path
 
@@ -989,27 +1645,26 @@ def plot_harmonic_spectrum(
     Returns:
         Path to saved PNG
     """
-    plt = _get_pyplot()
+    spectrum, freqs = _get_spectrum(samples, sample_rate)
+    magnitude_db = _mag_to_db(spectrum)
 
-    n_fft = next_power_of_2(len(samples))
-    win = np.hanning(len(samples))
-    spectrum = np.abs(np.fft.rfft(samples * win, n=n_fft))
-    freqs = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
-
-    magnitude_db = linear_to_dbfs(spectrum)
-
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = _acquire_fig((12, 6))
 
     ax.plot(freqs, magnitude_db, linewidth=0.5, alpha=0.8)
 
-    # Mark harmonics
-    for k in range(1, 11):
-        h_freq = fundamental_freq * k
-        if h_freq < sample_rate / 2:
-            ax.axvline(x=h_freq, color='r' if k == 1 else 'orange',
-                       linestyle='--', alpha=0.5, linewidth=0.5)
-            ax.annotate(f'H{k}', (h_freq, ax.get_ylim()[1] - 5),
-                       fontsize=8, ha='center')
+    # Mark harmonics: one LineCollection spanning the axes height, with the
+    # labels pinned just below the top edge
+    harmonics = np.arange(1, 11)
+    h_freqs = fundamental_freq * harmonics
+    in_band = h_freqs < sample_rate / 2
+    harmonics, h_freqs = harmonics[in_band], h_freqs[in_band]
+    marker_transform = ax.get_xaxis_transform()
+    ax.vlines(h_freqs, 0, 1, transform=marker_transform,
+              colors=['r' if k == 1 else 'orange' for k in harmonics],
+              linestyles='--', alpha=0.5, linewidth=0.5)
+    for k, h_freq in zip(harmonics, h_freqs):
+        ax.text(h_freq, 0.98, f'H{k}', transform=marker_transform,
+                fontsize=8, ha='center', va='top', clip_on=True)
 
     ax.set_xlabel('Frequency (Hz)')
     ax.set_ylabel('Magnitude (dBFS)')
@@ -1019,8 +1674,8 @@ def plot_harmonic_spectrum(
     ax.grid(True, alpha=0.3)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(str(output_path), dpi=150, bbox_inches='tight')
-    plt.close(fig)
+    fig.savefig(str(output_path), dpi=150, pil_kwargs=_PNG_PIL_KWARGS)
+    _release_fig(fig)
 
     return output_path
 
@@ -1046,16 +1701,10 @@ def plot_imd_spectrum(
     Returns:
         Path to saved PNG
     """
-    plt = _get_pyplot()
-
-    n_fft = next_power_of_2(len(samples))
-    win = np.hanning(len(samples))
-    spectrum = np.abs(np.fft.rfft(samples * win, n=n_fft))
-    freqs = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
-
-    magnitude_db = linear_to_dbfs(spectrum)
+    spectrum, freqs = _get_spectrum(samples, sample_rate)
+    magnitude_db = _mag_to_db(spectrum)
 
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = _acquire_fig((12, 6))
 
     ax.plot(freqs, magnitude_db, linewidth=0.5, alpha=0.8)
 
@@ -1070,10 +1719,13 @@ def plot_imd_spectrum(
         (2 * f2 - f1, '2f2-f1'),
     ]
 
+    imd_freqs = [(freq, name) for freq, name in imd_freqs if 0 < freq < sample_rate / 2]
+    marker_transform = ax.get_xaxis_transform()
+    ax.vlines([freq for freq, _ in imd_freqs], 0, 1, transform=marker_transform,
+              colors='red', linestyles='--', alpha=0.5, linewidth=0.5)
     for freq, name in imd_freqs:
-        if 0 < freq < sample_rate / 2:
-            ax.axvline(x=freq, color='red', linestyle='--', alpha=0.5, linewidth=0.5)
-            ax.annotate(name, (freq, ax.get_ylim()[1] - 5), fontsize=7, ha='center', color='red')
+        ax.text(freq, 0.98, name, transform=marker_transform,
+                fontsize=7, ha='center', va='top', color='red', clip_on=True)
 
     ax.set_xlabel('Frequency (Hz)')
     ax.set_ylabel('Magnitude (dBFS)')
@@ -1084,8 +1736,8 @@ def plot_imd_spectrum(
     ax.legend(loc='upper right')
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(str(output_path), dpi=150, bbox_inches='tight')
-    plt.close(fig)
+    fig.savefig(str(output_path), dpi=150, pil_kwargs=_PNG_PIL_KWARGS)
+    _release_fig(fig)
 
     return output_path
 
@@ -1109,11 +1761,9 @@ def plot_spectrogram(
     Returns:
         Path to saved PNG
     """
-    plt = _get_pyplot()
+    fig, ax = _acquire_fig((12, 6))
 
-    fig, ax = plt.subplots(figsize=(12, 6))
-
-    pcm = ax.pcolormesh(times, freqs, magnitude_db, shading='gouraud',
+    pcm = ax.pcolormesh(times, freqs, magnitude_db, shading='auto',
                         vmin=-80, vmax=0, cmap='magma')
 
     ax.set_xlabel('Time (s)')
@@ -1124,8 +1774,8 @@ def plot_spectrogram(
     fig.colorbar(pcm, ax=ax, label='Magnitude (dB)')
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(str(output_path), dpi=150, bbox_inches='tight')
-    plt.close(fig)
+    fig.savefig(str(output_path), dpi=150, pil_kwargs=_PNG_PIL_KWARGS)
+    _release_fig(fig)
 
     return output_path
 
@@ -1134,7 +1784,8 @@ def plot_step_response(
     samples: np.ndarray,
     sample_rate: int,
     output_path: Path,
-    title: str = "Step Response"
+    title: str = "Step Response",
+    dc_gain: Optional[float] = None
 ) -> Path:
     """Plot time-domain step response.
 
@@ -1143,22 +1794,24 @@ def plot_step_response(
         sample_rate: Sample rate in Hz
         output_path: Output PNG path
         title: Plot title
+        dc_gain: Steady-state level from compute_step_metrics (default:
+            mean of the last 10% of samples)
 
     Returns:
         Path to saved PNG
     """
-    plt = _get_pyplot()
-
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = _acquire_fig((10, 6))
 
     # Show first 50ms
     num_samples = min(len(samples), int(0.05 * sample_rate))
-    time_ms = np.arange(num_samples) / sample_rate * 1000
+    time_ms = _time_ms_axis(num_samples, sample_rate)
 
     ax.plot(time_ms, samples[:num_samples], linewidth=1.5)
 
     # Mark steady state
-    dc = np.mean(samples[int(len(samples) * 0.9):])
+    dc = dc_gain
+    if dc is None:
+        dc = np.mean(samples[int(len(samples) * 0.9):])
     ax.axhline(y=dc, color='g', linestyle='--', alpha=0.5, label=f'DC: {dc:.3f}')
 
     ax.set_xlabel('Time (ms)')
@@ -1168,8 +1821,8 @@ def plot_step_response(
     ax.legend()
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(str(output_path), dpi=150, bbox_inches='tight')
-    plt.close(fig)
+    fig.savefig(str(output_path), dpi=150, pil_kwargs=_PNG_PIL_KWARGS)
+    _release_fig(fig)
 
     return output_path
 
@@ -1191,13 +1844,11 @@ def plot_self_oscillation(
     Returns:
         Path to saved PNG
     """
-    plt = _get_pyplot()
-
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
+    fig, (ax1, ax2) = _acquire_fig((10, 8), nrows=2)
 
     # Waveform (first 50ms)
     num_samples = min(len(samples), int(0.05 * sample_rate))
-    time_ms = np.arange(num_samples) / sample_rate * 1000
+    time_ms = _time_ms_axis(num_samples, sample_rate)
     ax1.plot(time_ms, samples[:num_samples], linewidth=0.5)
     ax1.set_xlabel('Time (ms)')
     ax1.set_ylabel('Amplitude')
@@ -1205,10 +1856,8 @@ def plot_self_oscillation(
     ax1.grid(True, alpha=0.3)
 
     # Spectrum
-    n_fft = next_power_of_2(len(samples))
-    spectrum = np.abs(np.fft.rfft(samples, n=n_fft))
-    freqs = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
-    magnitude_db = linear_to_dbfs(spectrum)
+    spectrum, freqs = _get_spectrum(samples, sample_rate, window=None)
+    magnitude_db = _mag_to_db(spectrum)
 
     ax2.plot(freqs, magnitude_db, linewidth=0.5)
     ax2.set_xlabel('Frequency (Hz)')
@@ -1222,8 +1871,8 @@ def plot_self_oscillation(
     fig.tight_layout()
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(str(output_path), dpi=150, bbox_inches='tight')
-    plt.close(fig)
+    fig.savefig(str(output_path), dpi=150, pil_kwargs=_PNG_PIL_KWARGS)
+    _release_fig(fig)
 
     return output_path
 
@@ -1249,9 +1898,7 @@ def plot_comparison(
     Returns:
         Path to saved PNG
     """
-    plt = _get_pyplot()
-
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig, ax = _acquire_fig((12, 8))
 
     for name, x, y in results:
         if log_x:
@@ -1266,8 +1913,8 @@ def plot_comparison(
     ax.legend(loc='best', fontsize=8)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(str(output_path), dpi=150, bbox_inches='tight')
-    plt.close(fig)
+    fig.savefig(str(output_path), dpi=150, pil_kwargs=_PNG_PIL_KWARGS)
+    _release_fig(fig)
 
     return output_path
 
@@ -1276,6 +1923,10 @@ def plot_comparison(
 # RunFilters Integration
 # =============================================================================
 
+# Line prefix RunFilters prints after successfully writing an output file
+_RUNFILTERS_OK_PREFIX = "OK -> "
+
+
 def run_filters(
     runfilters_path: Path,
     input_wav: Path,
@@ -1322,17 +1973,82 @@ def run_filters(
     if verbose and result.stdout:
         print(result.stdout)
 
-    # Find generated files
-    if oversample > 0:
-        pattern = f"*_c{int(cutoff)}_r{resonance:.2f}_os{oversample}x.wav"
-    else:
-        pattern = f"*_c{int(cutoff)}_r{resonance:.2f}.wav"
-
-    output_files = list(output_dir.glob(pattern))
+    # RunFilters reports every file it wrote as "OK -> <path>", so the
+    # outputs come straight from stdout without scanning output_dir
+    output_files = [
+        Path(line[len(_RUNFILTERS_OK_PREFIX):])
+        for line in result.stdout.splitlines()
+        if line.startswith(_RUNFILTERS_OK_PREFIX)
+    ]
 
     return output_files
 
 
+def _list_wavs(directory: Path) -> List[Path]:
+    """List the WAV files in a directory (empty if it does not exist).
+
+    One os.scandir pass: no separate exists() check, and no per-entry stat
+    as with Path.glob.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [Path(entry.path) for entry in entries
+                    if entry.name.endswith(".wav") and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+def run_filters_batch(
+    runfilters_path: Path,
+    runs: List[Tuple[Path, float, float, int, Path]],
+    skip_existing: bool = False,
+    verbose: bool = False,
+    max_workers: Optional[int] = None
+) -> List[List[Path]]:
+    """Execute RunFilters.exe for several sweep points concurrently.
+
+    Every run writes to its own output directory, so concurrent runs never
+    touch each other's files. The DSP happens in the RunFilters processes,
+    so one waiting thread per in-flight run is enough to keep max_workers
+    of them busy.
+
+    Args:
+        runfilters_path: Path to RunFilters.exe
+        runs: (input_wav, cutoff, resonance, oversample, output_dir) tuples
+        skip_existing: Reuse the WAVs already in a run's output_dir
+        verbose: Print command output
+        max_workers: Concurrent RunFilters processes (default: CPU count)
+
+    Returns:
+        Lists of generated WAV files, aligned with runs
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    outputs = [None] * len(runs)
+    pending = []
+    for i, run in enumerate(runs):
+        output_dir = run[-1]
+        existing = _list_wavs(output_dir) if skip_existing else []
+        if existing:
+            outputs[i] = existing
+        else:
+            pending.append(i)
+
+    if len(pending) == 1:
+        outputs[pending[0]] = run_filters(runfilters_path, *runs[pending[0]], verbose)
+    elif pending:
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = {
+                i: executor.submit(run_filters, runfilters_path, *runs[i], verbose)
+                for i in pending
+            }
+            for i, future in futures.items():
+                outputs[i] = future.result()
+
+    return outputs
+
+
+@lru_cache(maxsize=None)
 def extract_filter_name(filename: str) -> str:
     """Extract filter name from output filename.
 
@@ -1342,13 +2058,126 @@ def extract_filter_name(filename: str) -> str:
     Returns:
         Filter name like 'Stilson'
     """
-    return filename.split('_c')[0]
+    return filename.split('_c', 1)[0]
+
+
+def read_filter_outputs(
+    output_files: List[Path],
+    filters: List[str]
+) -> List[Tuple[str, np.ndarray, int]]:
+    """Read the RunFilters outputs belonging to the selected filters.
+
+    Args:
+        output_files: WAV files written by RunFilters
+        filters: Filter names to keep
+
+    Returns:
+        List of (filter_name, samples, sample_rate) tuples
+    """
+    outputs = []
+    for wav_path in output_files:
+        filter_name = extract_filter_name(wav_path.stem)
+        if filter_name not in filters:
+            continue
+        samples, sr = read_wav(wav_path)
+        outputs.append((filter_name, samples, sr))
+    return outputs
+
+
+def analyze_batch(
+    outputs: List[Tuple[str, np.ndarray, int]],
+    batch_fn: Callable,
+    *args
+) -> list:
+    """Apply a batched analysis to filter outputs, one call per sample rate.
+
+    Args:
+        outputs: (filter_name, samples, sample_rate) tuples
+        batch_fn: Batched analysis such as compute_thd_batch
+        *args: Extra arguments passed after the sample rate
+
+    Returns:
+        Analysis results aligned with outputs
+    """
+    results = [None] * len(outputs)
+    by_rate = {}
+    for i, (_, _, sr) in enumerate(outputs):
+        by_rate.setdefault(sr, []).append(i)
+    for sr, indices in by_rate.items():
+        batch = batch_fn([outputs[i][1] for i in indices], sr, *args)
+        for i, res in zip(indices, batch):
+            results[i] = res
+    return results
 
 
 # =============================================================================
 # Test Orchestration
 # =============================================================================
 
+# Background plot rendering, active while run_test_suite has only one test
+# to run and would otherwise leave the remaining workers idle
+_plot_executor = None
+_plot_futures = []
+
+
+def _init_plot_worker() -> None:
+    """Plot pool initializer: load pyplot (on Agg) before the first job."""
+    _get_pyplot()
+
+
+def start_plot_pool(max_workers: int) -> None:
+    """Send subsequent submit_plot calls to a pool of worker processes.
+
+    Args:
+        max_workers: Number of plot worker processes
+    """
+    global _plot_executor
+    from concurrent.futures import ProcessPoolExecutor
+
+    _plot_executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_plot_worker)
+
+
+def submit_plot(plot_fn: Callable, *args, **kwargs) -> Path:
+    """Render a plot in the plot pool if one is running, else right away.
+
+    Every plot_* function takes plain arrays and paths and writes its PNG
+    to output_path, so the path is known before the plot is drawn.
+
+    Args:
+        plot_fn: Plot function such as plot_frequency_response
+        *args: Positional arguments for plot_fn
+        **kwargs: Keyword arguments for plot_fn
+
+    Returns:
+        Path of the PNG (written once finish_plots returns)
+    """
+    if _plot_executor is None:
+        return plot_fn(*args, **kwargs)
+
+    output_path = inspect.signature(plot_fn).bind(*args, **kwargs).arguments["output_path"]
+    _plot_futures.append(_plot_executor.submit(plot_fn, *args, **kwargs))
+    return output_path
+
+
+def finish_plots() -> None:
+    """Wait for queued plots (re-raising any failure) and stop the pool."""
+    global _plot_executor
+    futures = list(_plot_futures)
+    _plot_futures.clear()
+    for future in futures:
+        future.result()
+
+    if _plot_executor is not None:
+        _plot_executor.shutdown()
+        _plot_executor = None
+
+
+# Frequency responses computed by run_linear_response_test in this process,
+# keyed by resolved WAV path, so generate_comparison_plots can overlay them
+# without reading and transforming every output a second time
+_linear_responses = {}
+
+
 def run_linear_response_test(
     runfilters_path: Path,
     inputs_dir: Path,
@@ -1360,7 +2189,8 @@ def run_linear_response_test(
     oversamples: List[int],
     skip_existing: bool,
     no_plots: bool,
-    verbose: bool
+    verbose: bool,
+    max_workers: Optional[int] = None
 ) -> List[AnalysisResult]:
     """Run linear frequency response tests.
 
@@ -1376,6 +2206,7 @@ def run_linear_response_test(
         skip_existing: Skip tests with existing outputs
         no_plots: Skip plot generation
         verbose: Print progress
+        max_workers: Concurrent RunFilters processes (default: CPU count)
 
     Returns:
         List of AnalysisResult objects
@@ -1384,69 +2215,62 @@ def run_linear_response_test(
     resonance = 0.0
 
     # Generate impulse signal
-    impulse = generate_impulse(sample_rate=sample_rate)
-    impulse_path = save_test_signal(impulse, inputs_dir)
+    impulse_path = cached_test_signal(generate_impulse, inputs_dir, sample_rate=sample_rate)
 
-    for cutoff in cutoffs:
-        for oversample in oversamples:
-            if verbose:
-                print(f"  Linear response: cutoff={cutoff}, os={oversample}x")
-
-            test_dir = wav_dir / "linear_response" / f"c{int(cutoff)}_r{resonance:.2f}_os{oversample}"
+    sweep = [(cutoff, oversample) for cutoff in cutoffs for oversample in oversamples]
+    runs = [
+        (impulse_path, cutoff, resonance, oversample,
+         wav_dir / "linear_response" / f"c{int(cutoff)}_r{resonance:.2f}_os{oversample}")
+        for cutoff, oversample in sweep
+    ]
+    sweep_outputs = run_filters_batch(
+        runfilters_path, runs, skip_existing, verbose, max_workers
+    )
 
-            # Check if we should skip
-            if skip_existing and test_dir.exists() and list(test_dir.glob("*.wav")):
-                output_files = list(test_dir.glob("*.wav"))
-            else:
-                output_files = run_filters(
-                    runfilters_path, impulse_path, cutoff, resonance,
-                    oversample, test_dir, verbose
-                )
+    for (cutoff, oversample), output_files in zip(sweep, sweep_outputs):
+        if verbose:
+            print(f"  Linear response: cutoff={cutoff}, os={oversample}x")
 
-            for wav_path in output_files:
-                filter_name = extract_filter_name(wav_path.stem)
+        for wav_path in output_files:
+            filter_name = extract_filter_name(wav_path.stem)
 
-                if filter_name not in filters:
-                    continue
+            if filter_name not in filters:
+                continue
 
-                samples, sr = read_wav(wav_path)
+            samples, sr = read_wav(wav_path)
 
-                # Compute frequency response
-                freqs, mag_db, phase_rad = compute_frequency_response(samples, sr)
-                group_delay = compute_group_delay(phase_rad, freqs)
-
-                result = AnalysisResult(
-                    filter_name=filter_name,
-                    test_case="linear_response",
-                    cutoff_hz=cutoff,
-                    resonance=resonance,
-                    oversample=oversample,
-                    metrics={
-                        "cutoff_measured_hz": float(freqs[np.argmin(np.abs(mag_db - mag_db[0] + 3))]),
-                        "passband_ripple_db": float(np.max(mag_db[:int(len(mag_db) * 0.1)]) - np.min(mag_db[:int(len(mag_db) * 0.1)])),
-                        "stopband_atten_db": float(-np.min(mag_db[int(len(mag_db) * 0.6):])),
-                    }
-                )
+            # Compute frequency response
+            freqs, mag_db, phase_rad = compute_frequency_response(samples, sr)
 
-                if not no_plots:
-                    os_suffix = f"_os{oversample}x" if oversample > 0 else ""
+            result = AnalysisResult(
+                filter_name=filter_name,
+                test_case="linear_response",
+                cutoff_hz=cutoff,
+                resonance=resonance,
+                oversample=oversample,
+                metrics=compute_linear_metrics(freqs, mag_db)
+            )
 
-                    mag_plot = plot_frequency_response(
-                        freqs, mag_db,
-                        plots_dir / "linear_response" / f"{filter_name}_c{int(cutoff)}{os_suffix}_magnitude.png",
-                        f"{filter_name} Magnitude Response (fc={cutoff}Hz)",
-                        cutoff
-                    )
-                    result.plots_generated.append(str(mag_plot))
+            if not no_plots:
+                _linear_responses[wav_path.resolve()] = (freqs, mag_db)
+                os_suffix = f"_os{oversample}x" if oversample > 0 else ""
+
+                mag_plot = submit_plot(
+                    plot_frequency_response, freqs, mag_db,
+                    plots_dir / "linear_response" / f"{filter_name}_c{int(cutoff)}{os_suffix}_magnitude.png",
+                    f"{filter_name} Magnitude Response (fc={cutoff}Hz)",
+                    cutoff
+                )
+                result.plots_generated.append(str(mag_plot))
 
-                    phase_plot = plot_phase_response(
-                        freqs, phase_rad,
-                        plots_dir / "linear_response" / f"{filter_name}_c{int(cutoff)}{os_suffix}_phase.png",
-                        f"{filter_name} Phase Response (fc={cutoff}Hz)"
-                    )
-                    result.plots_generated.append(str(phase_plot))
+                phase_plot = submit_plot(
+                    plot_phase_response, freqs, phase_rad,
+                    plots_dir / "linear_response" / f"{filter_name}_c{int(cutoff)}{os_suffix}_phase.png",
+                    f"{filter_name} Phase Response (fc={cutoff}Hz)"
+                )
+                result.plots_generated.append(str(phase_plot))
 
-                results.append(result)
+            results.append(result)
 
     return results
 
@@ -1461,32 +2285,31 @@ def run_resonance_test(
     filters: List[str],
     skip_existing: bool,
     no_plots: bool,
-    verbose: bool
+    verbose: bool,
+    max_workers: Optional[int] = None
 ) -> List[AnalysisResult]:
     """Run resonance peak tracking tests."""
     results = []
     resonance = 0.9
     oversample = 0
 
-    chirp = generate_chirp(sample_rate=sample_rate, duration=5.0)
-    chirp_path = save_test_signal(chirp, inputs_dir)
+    chirp_path = cached_test_signal(generate_chirp, inputs_dir, sample_rate=sample_rate, duration=5.0)
 
     test_cutoffs = [c for c in cutoffs if c in [200, 1000, 5000]]
 
-    for cutoff in test_cutoffs:
+    runs = [
+        (chirp_path, cutoff, resonance, oversample,
+         wav_dir / "resonance" / f"c{int(cutoff)}_r{resonance:.2f}_os{oversample}")
+        for cutoff in test_cutoffs
+    ]
+    sweep_outputs = run_filters_batch(
+        runfilters_path, runs, skip_existing, verbose, max_workers
+    )
+
+    for cutoff, output_files in zip(test_cutoffs, sweep_outputs):
         if verbose:
             print(f"  Resonance test: cutoff={cutoff}")
 
-        test_dir = wav_dir / "resonance" / f"c{int(cutoff)}_r{resonance:.2f}_os{oversample}"
-
-        if skip_existing and test_dir.exists() and list(test_dir.glob("*.wav")):
-            output_files = list(test_dir.glob("*.wav"))
-        else:
-            output_files = run_filters(
-                runfilters_path, chirp_path, cutoff, resonance,
-                oversample, test_dir, verbose
-            )
-
         for wav_path in output_files:
             filter_name = extract_filter_name(wav_path.stem)
 
@@ -1497,14 +2320,7 @@ def run_resonance_test(
             times, freqs, spec_db = compute_spectrogram(samples, sr)
 
             # Find peak in spectrogram around cutoff
-            freq_mask = (freqs > cutoff * 0.5) & (freqs < cutoff * 1.5)
-            if np.any(freq_mask):
-                peak_freq_idx = np.argmax(np.mean(spec_db[freq_mask, :], axis=1))
-                peak_freq = freqs[freq_mask][peak_freq_idx]
-                peak_amp = np.max(spec_db[freq_mask, :])
-            else:
-                peak_freq = cutoff
-                peak_amp = -80
+            peak_freq, peak_amp = compute_resonance_peak(freqs, spec_db, cutoff)
 
             result = AnalysisResult(
                 filter_name=filter_name,
@@ -1513,15 +2329,15 @@ def run_resonance_test(
                 resonance=resonance,
                 oversample=oversample,
                 metrics={
-                    "peak_freq_hz": float(peak_freq),
-                    "peak_amplitude_db": float(peak_amp),
+                    "peak_freq_hz": peak_freq,
+                    "peak_amplitude_db": peak_amp,
                     "freq_error_percent": float(abs(peak_freq - cutoff) / cutoff * 100),
                 }
             )
 
             if not no_plots:
-                spec_plot = plot_spectrogram(
-                    times, freqs, spec_db,
+                spec_plot = submit_plot(
+                    plot_spectrogram, times, freqs, spec_db,
                     plots_dir / "resonance" / f"{filter_name}_c{int(cutoff)}_spectrogram.png",
                     f"{filter_name} Resonance Test (fc={cutoff}Hz, Q=0.9)"
                 )
@@ -1542,40 +2358,38 @@ def run_selfoscillation_test(
     filters: List[str],
     skip_existing: bool,
     no_plots: bool,
-    verbose: bool
+    verbose: bool,
+    max_workers: Optional[int] = None
 ) -> List[AnalysisResult]:
     """Run self-oscillation detection tests."""
     results = []
     resonance = 1.0
     oversample = 0
 
-    silence = generate_silence(sample_rate=sample_rate, length=sample_rate * 2)
-    silence_path = save_test_signal(silence, inputs_dir)
+    silence_path = cached_test_signal(
+        generate_silence, inputs_dir, sample_rate=sample_rate, length=sample_rate * 2
+    )
 
     test_cutoffs = [c for c in cutoffs if c in [200, 1000, 5000]]
 
-    for cutoff in test_cutoffs:
+    runs = [
+        (silence_path, cutoff, resonance, oversample,
+         wav_dir / "selfoscillation" / f"c{int(cutoff)}_r{resonance:.2f}_os{oversample}")
+        for cutoff in test_cutoffs
+    ]
+    sweep_outputs = run_filters_batch(
+        runfilters_path, runs, skip_existing, verbose, max_workers
+    )
+
+    for cutoff, output_files in zip(test_cutoffs, sweep_outputs):
         if verbose:
             print(f"  Self-oscillation test: cutoff={cutoff}")
 
-        test_dir = wav_dir / "selfoscillation" / f"c{int(cutoff)}_r{resonance:.2f}_os{oversample}"
-
-        if skip_existing and test_dir.exists() and list(test_dir.glob("*.wav")):
-            output_files = list(test_dir.glob("*.wav"))
-        else:
-            output_files = run_filters(
-                runfilters_path, silence_path, cutoff, resonance,
-                oversample, test_dir, verbose
-            )
-
-        for wav_path in output_files:
-            filter_name = extract_filter_name(wav_path.stem)
+        # All outputs of this cutoff share one batched FFT
+        outputs = read_filter_outputs(output_files, filters)
+        analyses = analyze_batch(outputs, detect_self_oscillation_batch)
 
-            if filter_name not in filters:
-                continue
-
-            samples, sr = read_wav(wav_path)
-            osc_info = detect_self_oscillation(samples, sr)
+        for (filter_name, samples, sr), osc_info in zip(outputs, analyses):
 
             result = AnalysisResult(
                 filter_name=filter_name,
@@ -1587,8 +2401,8 @@ def run_selfoscillation_test(
             )
 
             if not no_plots:
-                osc_plot = plot_self_oscillation(
-                    samples, sr,
+                osc_plot = submit_plot(
+                    plot_self_oscillation, samples, sr,
                     plots_dir / "selfoscillation" / f"{filter_name}_c{int(cutoff)}_oscillation.png",
                     f"{filter_name} Self-Oscillation (fc={cutoff}Hz)"
                 )
@@ -1608,7 +2422,8 @@ def run_thd_test(
     filters: List[str],
     skip_existing: bool,
     no_plots: bool,
-    verbose: bool
+    verbose: bool,
+    max_workers: Optional[int] = None
 ) -> List[AnalysisResult]:
     """Run THD measurements at different levels."""
     results = []
@@ -1617,33 +2432,31 @@ def run_thd_test(
     oversample = 0
     test_freq = 1000
 
-    for level_dbfs in [-18, -12, -6]:
+    levels_dbfs = [-18, -12, -6]
+    sine_paths = [
+        cached_test_signal(
+            generate_sine, inputs_dir, sample_rate=sample_rate, frequency=test_freq,
+            duration=1.0, amplitude_dbfs=level_dbfs
+        )
+        for level_dbfs in levels_dbfs
+    ]
+    runs = [
+        (sine_path, cutoff, resonance, oversample, wav_dir / "thd" / f"level{level_dbfs}dbfs")
+        for sine_path, level_dbfs in zip(sine_paths, levels_dbfs)
+    ]
+    sweep_outputs = run_filters_batch(
+        runfilters_path, runs, skip_existing, verbose, max_workers
+    )
+
+    for level_dbfs, output_files in zip(levels_dbfs, sweep_outputs):
         if verbose:
             print(f"  THD test: level={level_dbfs} dBFS")
 
-        sine = generate_sine(sample_rate=sample_rate, frequency=test_freq,
-                            duration=1.0, amplitude_dbfs=level_dbfs)
-        sine.name = f"sine_{test_freq}hz_{level_dbfs}dbfs_{sample_rate}"
-        sine_path = save_test_signal(sine, inputs_dir)
+        # All outputs of this level share one batched FFT
+        outputs = read_filter_outputs(output_files, filters)
+        analyses = analyze_batch(outputs, compute_thd_batch, test_freq)
 
-        test_dir = wav_dir / "thd" / f"level{level_dbfs}dbfs"
-
-        if skip_existing and test_dir.exists() and list(test_dir.glob("*.wav")):
-            output_files = list(test_dir.glob("*.wav"))
-        else:
-            output_files = run_filters(
-                runfilters_path, sine_path, cutoff, resonance,
-                oversample, test_dir, verbose
-            )
-
-        for wav_path in output_files:
-            filter_name = extract_filter_name(wav_path.stem)
-
-            if filter_name not in filters:
-                continue
-
-            samples, sr = read_wav(wav_path)
-            thd_pct, harmonics = compute_thd(samples, sr, test_freq)
+        for (filter_name, samples, sr), (thd_pct, harmonics) in zip(outputs, analyses):
 
             result = AnalysisResult(
                 filter_name=filter_name,
@@ -1659,8 +2472,8 @@ def run_thd_test(
             )
 
             if not no_plots:
-                harm_plot = plot_harmonic_spectrum(
-                    samples, sr, test_freq,
+                harm_plot = submit_plot(
+                    plot_harmonic_spectrum, samples, sr, test_freq,
                     plots_dir / "thd" / f"{filter_name}_{level_dbfs}dbfs_harmonics.png",
                     f"{filter_name} THD ({level_dbfs} dBFS input)"
                 )
@@ -1680,7 +2493,8 @@ def run_imd_test(
     filters: List[str],
     skip_existing: bool,
     no_plots: bool,
-    verbose: bool
+    verbose: bool,
+    max_workers: Optional[int] = None
 ) -> List[AnalysisResult]:
     """Run IMD measurements."""
     results = []
@@ -1692,27 +2506,20 @@ def run_imd_test(
     if verbose:
         print(f"  IMD test: {f1}+{f2} Hz")
 
-    twotone = generate_two_tone(sample_rate=sample_rate, f1=f1, f2=f2, duration=1.0)
-    twotone_path = save_test_signal(twotone, inputs_dir)
-
-    test_dir = wav_dir / "imd"
-
-    if skip_existing and test_dir.exists() and list(test_dir.glob("*.wav")):
-        output_files = list(test_dir.glob("*.wav"))
-    else:
-        output_files = run_filters(
-            runfilters_path, twotone_path, cutoff, resonance,
-            oversample, test_dir, verbose
-        )
+    twotone_path = cached_test_signal(
+        generate_two_tone, inputs_dir, sample_rate=sample_rate, f1=f1, f2=f2, duration=1.0
+    )
 
-    for wav_path in output_files:
-        filter_name = extract_filter_name(wav_path.stem)
+    [output_files] = run_filters_batch(
+        runfilters_path, [(twotone_path, cutoff, resonance, oversample, wav_dir / "imd")],
+        skip_existing, verbose, max_workers
+    )
 
-        if filter_name not in filters:
-            continue
+    # All outputs share one batched FFT
+    outputs = read_filter_outputs(output_files, filters)
+    analyses = analyze_batch(outputs, compute_imd_batch, f1, f2)
 
-        samples, sr = read_wav(wav_path)
-        imd_db, sidebands = compute_imd(samples, sr, f1, f2)
+    for (filter_name, samples, sr), (imd_db, sidebands) in zip(outputs, analyses):
 
         result = AnalysisResult(
             filter_name=filter_name,
@@ -1727,8 +2534,8 @@ def run_imd_test(
         )
 
         if not no_plots:
-            imd_plot = plot_imd_spectrum(
-                samples, sr, f1, f2,
+            imd_plot = submit_plot(
+                plot_imd_spectrum, samples, sr, f1, f2,
                 plots_dir / "imd" / f"{filter_name}_imd.png",
                 f"{filter_name} IMD ({f1}+{f2} Hz)"
             )
@@ -1749,7 +2556,8 @@ def run_aliasing_test(
     oversamples: List[int],
     skip_existing: bool,
     no_plots: bool,
-    verbose: bool
+    verbose: bool,
+    max_workers: Optional[int] = None
 ) -> List[AnalysisResult]:
     """Run aliasing stress tests comparing oversampling factors."""
     results = []
@@ -1759,68 +2567,51 @@ def run_aliasing_test(
     # High frequency test tones
     test_freqs = [10000, 15000]
 
-    for test_freq in test_freqs:
-        if verbose:
-            print(f"  Aliasing test: {test_freq} Hz")
-
-        sine = generate_sine(sample_rate=sample_rate, frequency=test_freq,
-                            duration=1.0, amplitude_dbfs=-6)
-        sine.name = f"sine_{test_freq}hz_alias_{sample_rate}"
-        sine_path = save_test_signal(sine, inputs_dir)
-
-        for oversample in [0, 4]:
-            if oversample not in oversamples:
-                continue
-
-            test_dir = wav_dir / "aliasing" / f"f{test_freq}_os{oversample}"
-
-            if skip_existing and test_dir.exists() and list(test_dir.glob("*.wav")):
-                output_files = list(test_dir.glob("*.wav"))
-            else:
-                output_files = run_filters(
-                    runfilters_path, sine_path, cutoff, resonance,
-                    oversample, test_dir, verbose
-                )
+    sine_paths = {
+        test_freq: cached_test_signal(
+            generate_sine, inputs_dir, sample_rate=sample_rate, frequency=test_freq,
+            duration=1.0, amplitude_dbfs=-6
+        )
+        for test_freq in test_freqs
+    }
 
-            for wav_path in output_files:
-                filter_name = extract_filter_name(wav_path.stem)
+    sweep = [
+        (test_freq, oversample)
+        for test_freq in test_freqs
+        for oversample in [0, 4]
+        if oversample in oversamples
+    ]
+    runs = [
+        (sine_paths[test_freq], cutoff, resonance, oversample,
+         wav_dir / "aliasing" / f"f{test_freq}_os{oversample}")
+        for test_freq, oversample in sweep
+    ]
+    sweep_outputs = run_filters_batch(
+        runfilters_path, runs, skip_existing, verbose, max_workers
+    )
 
-                if filter_name not in filters:
-                    continue
+    for (test_freq, oversample), output_files in zip(sweep, sweep_outputs):
+        if verbose:
+            print(f"  Aliasing test: {test_freq} Hz, os={oversample}x")
 
-                samples, sr = read_wav(wav_path)
+        # All outputs of this sweep point share one FFT size and batched FFT
+        outputs = read_filter_outputs(output_files, filters)
+        alias_ratios = analyze_batch(outputs, compute_alias_ratio_batch, test_freq)
 
-                # Compute energy in alias bands (below original frequency)
-                n_fft = next_power_of_2(len(samples))
-                spectrum = np.abs(np.fft.rfft(samples, n=n_fft))
-                freqs = np.fft.rfftfreq(n_fft, 1.0 / sr)
-
-                # Energy in expected band
-                main_mask = (freqs > test_freq * 0.9) & (freqs < test_freq * 1.1)
-                main_energy = np.sum(spectrum[main_mask] ** 2)
-
-                # Energy in alias band (below fundamental, excluding DC)
-                alias_mask = (freqs > 100) & (freqs < test_freq * 0.5)
-                alias_energy = np.sum(spectrum[alias_mask] ** 2)
-
-                if main_energy > 0:
-                    alias_ratio_db = 10 * np.log10(alias_energy / main_energy + 1e-12)
-                else:
-                    alias_ratio_db = -120
-
-                result = AnalysisResult(
-                    filter_name=filter_name,
-                    test_case="aliasing",
-                    cutoff_hz=cutoff,
-                    resonance=resonance,
-                    oversample=oversample,
-                    metrics={
-                        "test_freq_hz": test_freq,
-                        "alias_ratio_db": float(alias_ratio_db),
-                    }
-                )
+        for (filter_name, _, _), alias_ratio_db in zip(outputs, alias_ratios):
+            result = AnalysisResult(
+                filter_name=filter_name,
+                test_case="aliasing",
+                cutoff_hz=cutoff,
+                resonance=resonance,
+                oversample=oversample,
+                metrics={
+                    "test_freq_hz": test_freq,
+                    "alias_ratio_db": alias_ratio_db,
+                }
+            )
 
-                results.append(result)
+            results.append(result)
 
     return results
 
@@ -1834,30 +2625,29 @@ def run_step_test(
     filters: List[str],
     skip_existing: bool,
     no_plots: bool,
-    verbose: bool
+    verbose: bool,
+    max_workers: Optional[int] = None
 ) -> List[AnalysisResult]:
     """Run step response tests at different resonance levels."""
     results = []
     cutoff = 1000
     oversample = 0
 
-    step = generate_step(sample_rate=sample_rate)
-    step_path = save_test_signal(step, inputs_dir)
+    step_path = cached_test_signal(generate_step, inputs_dir, sample_rate=sample_rate)
 
-    for resonance in [0.0, 0.5, 0.9]:
+    resonances = [0.0, 0.5, 0.9]
+    runs = [
+        (step_path, cutoff, resonance, oversample, wav_dir / "step" / f"r{resonance:.2f}")
+        for resonance in resonances
+    ]
+    sweep_outputs = run_filters_batch(
+        runfilters_path, runs, skip_existing, verbose, max_workers
+    )
+
+    for resonance, output_files in zip(resonances, sweep_outputs):
         if verbose:
             print(f"  Step response test: resonance={resonance}")
 
-        test_dir = wav_dir / "step" / f"r{resonance:.2f}"
-
-        if skip_existing and test_dir.exists() and list(test_dir.glob("*.wav")):
-            output_files = list(test_dir.glob("*.wav"))
-        else:
-            output_files = run_filters(
-                runfilters_path, step_path, cutoff, resonance,
-                oversample, test_dir, verbose
-            )
-
         for wav_path in output_files:
             filter_name = extract_filter_name(wav_path.stem)
 
@@ -1877,10 +2667,11 @@ def run_step_test(
             )
 
             if not no_plots:
-                step_plot = plot_step_response(
-                    samples, sr,
+                step_plot = submit_plot(
+                    plot_step_response, samples, sr,
                     plots_dir / "step" / f"{filter_name}_r{resonance:.2f}_step.png",
-                    f"{filter_name} Step Response (Q={resonance})"
+                    f"{filter_name} Step Response (Q={resonance})",
+                    dc_gain=step_metrics["dc_gain"]
                 )
                 result.plots_generated.append(str(step_plot))
 
@@ -1898,33 +2689,35 @@ def run_noise_test(
     filters: List[str],
     skip_existing: bool,
     no_plots: bool,
-    verbose: bool
+    verbose: bool,
+    max_workers: Optional[int] = None
 ) -> List[AnalysisResult]:
     """Run noise shaping / PSD analysis tests."""
     results = []
     cutoff = 1000
     oversample = 0
 
-    noise = generate_white_noise(sample_rate=sample_rate, duration=5.0)
-    noise_path = save_test_signal(noise, inputs_dir)
+    noise_path = cached_test_signal(
+        generate_white_noise, inputs_dir, sample_rate=sample_rate, duration=5.0
+    )
 
-    # Compute input PSD for reference
-    input_freqs, input_psd = compute_psd(noise.samples, sample_rate)
+    # Compute input PSD for reference (from the file the filters process)
+    noise_samples, _ = read_wav(noise_path)
+    input_freqs, input_psd = compute_psd(noise_samples, sample_rate)
 
-    for resonance in [0.0, 0.9]:
+    resonances = [0.0, 0.9]
+    runs = [
+        (noise_path, cutoff, resonance, oversample, wav_dir / "noise" / f"r{resonance:.2f}")
+        for resonance in resonances
+    ]
+    sweep_outputs = run_filters_batch(
+        runfilters_path, runs, skip_existing, verbose, max_workers
+    )
+
+    for resonance, output_files in zip(resonances, sweep_outputs):
         if verbose:
             print(f"  Noise shaping test: resonance={resonance}")
 
-        test_dir = wav_dir / "noise" / f"r{resonance:.2f}"
-
-        if skip_existing and test_dir.exists() and list(test_dir.glob("*.wav")):
-            output_files = list(test_dir.glob("*.wav"))
-        else:
-            output_files = run_filters(
-                runfilters_path, noise_path, cutoff, resonance,
-                oversample, test_dir, verbose
-            )
-
         for wav_path in output_files:
             filter_name = extract_filter_name(wav_path.stem)
 
@@ -1935,8 +2728,8 @@ def run_noise_test(
             output_freqs, output_psd = compute_psd(samples, sr)
 
             # Compute attenuation at cutoff and in stopband
-            cutoff_idx = np.argmin(np.abs(output_freqs - cutoff))
-            stopband_idx = np.argmin(np.abs(output_freqs - cutoff * 4))
+            cutoff_idx = _nearest_bin(output_freqs, cutoff)
+            stopband_idx = _nearest_bin(output_freqs, cutoff * 4)
 
             result = AnalysisResult(
                 filter_name=filter_name,
@@ -1968,15 +2761,15 @@ def generate_comparison_plots(
 
     # Find all linear response outputs for comparison
     linear_dir = wav_dir / "linear_response"
-    if not linear_dir.exists():
+    try:
+        with os.scandir(linear_dir) as entries:
+            subdirs = [entry for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
         return plots
 
     # Group by cutoff
     cutoff_groups = {}
-    for subdir in linear_dir.iterdir():
-        if not subdir.is_dir():
-            continue
-
+    for subdir in subdirs:
         # Parse cutoff from directory name
         parts = subdir.name.split('_')
         cutoff = int(parts[0][1:])  # e.g., 'c1000' -> 1000
@@ -1984,7 +2777,7 @@ def generate_comparison_plots(
         if cutoff not in cutoff_groups:
             cutoff_groups[cutoff] = []
 
-        for wav_path in subdir.glob("*.wav"):
+        for wav_path in _list_wavs(subdir.path):
             filter_name = extract_filter_name(wav_path.stem)
             if filter_name in filters:
                 cutoff_groups[cutoff].append((filter_name, wav_path))
@@ -1996,13 +2789,18 @@ def generate_comparison_plots(
 
         comparison_data = []
         for filter_name, wav_path in files:
-            samples, sr = read_wav(wav_path)
-            freqs, mag_db, _ = compute_frequency_response(samples, sr)
-            comparison_data.append((filter_name, freqs, mag_db))
+            # Reuse the linear test's response; outputs analyzed in a worker
+            # process are not cached here and are read back from disk
+            response = _linear_responses.pop(wav_path.resolve(), None)
+            if response is None:
+                samples, sr = read_wav(wav_path)
+                freqs, mag_db, _ = compute_frequency_response(samples, sr)
+                response = (freqs, mag_db)
+            comparison_data.append((filter_name, *response))
 
         if comparison_data:
-            plot_path = plot_comparison(
-                comparison_data,
+            plot_path = submit_plot(
+                plot_comparison, comparison_data,
                 plots_dir / "comparison" / f"all_filters_c{cutoff}_magnitude.png",
                 title=f"Filter Comparison (fc={cutoff} Hz)"
             )
@@ -2025,6 +2823,85 @@ from dashboard_generator import generate_dashboard
 # Main Execution
 # =============================================================================
 
+# Test name -> (runner, metrics filename, progress label, test-specific
+# arguments passed between the common leading arguments and the flags)
+_TEST_RUNNERS = {
+    "linear": (run_linear_response_test, "linear_response.json",
+               "linear response tests", ("cutoffs", "filters", "oversamples")),
+    "resonance": (run_resonance_test, "resonance.json",
+                  "resonance tests", ("cutoffs", "filters")),
+    "selfoscillation": (run_selfoscillation_test, "selfoscillation.json",
+                        "self-oscillation tests", ("cutoffs", "filters")),
+    "thd": (run_thd_test, "thd.json", "THD tests", ("filters",)),
+    "imd": (run_imd_test, "imd.json", "IMD tests", ("filters",)),
+    "aliasing": (run_aliasing_test, "aliasing.json",
+                 "aliasing tests", ("filters", "oversamples")),
+    "step": (run_step_test, "step.json", "step response tests", ("filters",)),
+    "noise": (run_noise_test, "noise.json", "noise shaping tests", ("filters",)),
+}
+
+
+def compute_run_id(config: Dict[str, Any]) -> str:
+    """Return a stable run ID derived from the test configuration.
+
+    Args:
+        config: JSON-serializable test matrix and environment description
+
+    Returns:
+        12-character hex digest
+    """
+    key = json.dumps(config, sort_keys=True).encode()
+    return hashlib.sha1(key).hexdigest()[:12]
+
+
+# AnalysisResult fields in declaration order (the key order of its records)
+_RESULT_FIELDS = tuple(f.name for f in fields(AnalysisResult))
+
+
+def _result_record(result: AnalysisResult) -> Dict[str, Any]:
+    """Return the JSON record of an analysis result.
+
+    A shallow replacement for asdict: each result's metrics dict and plot
+    list are built fresh by its runner and never modified afterwards, so
+    the record shares them instead of deep-copying every field.
+
+    Args:
+        result: Result returned by a test runner
+
+    Returns:
+        Dict with one entry per AnalysisResult field
+    """
+    return {name: getattr(result, name) for name in _RESULT_FIELDS}
+
+
+def _run_test(job: tuple) -> List[AnalysisResult]:
+    """Run a single test of the suite.
+
+    Defined at module level so it can be submitted to a worker process.
+
+    Args:
+        job: Tuple of (test_name, common_args, options) where common_args
+            are the leading arguments shared by every runner and options
+            holds the test-specific lists, the skip/plot/verbose flags and
+            the CPU budget of the worker
+
+    Returns:
+        List of AnalysisResult from the test runner
+    """
+    test, common, options = job
+    runner, _, _, arg_names = _TEST_RUNNERS[test]
+    _set_fft_threads(options["cpu_budget"])
+    results = runner(
+        *common, *(options[name] for name in arg_names),
+        options["skip_existing"], options["no_plots"], options["verbose"],
+        options["cpu_budget"]
+    )
+
+    # Saved per test rather than at exit: pool workers skip atexit handlers
+    _save_fftw_wisdom()
+    return results
+
+
 def run_test_suite(
     runfilters_path: Path,
     output_dir: Path,
@@ -2036,7 +2913,8 @@ def run_test_suite(
     oversamples: List[int],
     skip_existing: bool,
     no_plots: bool,
-    verbose: bool
+    verbose: bool,
+    jobs: Optional[int] = None
 ) -> MetricsSummary:
     """Run the complete test suite.
 
@@ -2049,15 +2927,31 @@ def run_test_suite(
         cutoffs: List of cutoff frequencies
         resonances: List of resonance values
         oversamples: List of oversample factors
-        skip_existing: Skip tests with existing outputs
+        skip_existing: Reuse outputs and saved metrics from an earlier run
+            of the same configuration
         no_plots: Skip plot generation
         verbose: Print progress
+        jobs: Number of tests to run in parallel worker processes
+            (default: one per CPU core; 1 runs everything in-process)
 
     Returns:
         MetricsSummary object with all results
     """
-    # Create run directory with timestamp
-    run_id = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+    # Run directory named by a hash of the test matrix, so re-running an
+    # unchanged configuration lands in the same directory; the RunFilters
+    # build is part of the key so a rebuilt binary never reuses old results
+    runfilters_stat = runfilters_path.stat()
+    run_id = compute_run_id({
+        "sample_rate": sample_rate,
+        "tests": tests,
+        "filters": filters,
+        "cutoffs": cutoffs,
+        "resonances": resonances,
+        "oversamples": oversamples,
+        "plots": not no_plots,
+        "runfilters": [str(runfilters_path.resolve()), runfilters_stat.st_size,
+                       runfilters_stat.st_mtime_ns],
+    })
     run_dir = output_dir / run_id
 
     inputs_dir = run_dir / "inputs"
@@ -2068,112 +2962,91 @@ def run_test_suite(
     for d in [inputs_dir, wav_dir, plots_dir, metrics_dir]:
         d.mkdir(parents=True, exist_ok=True)
 
-    all_results = []
+    common = (runfilters_path, inputs_dir, wav_dir, plots_dir, sample_rate)
+    options = {
+        "cutoffs": cutoffs,
+        "filters": filters,
+        "oversamples": oversamples,
+        "skip_existing": skip_existing,
+        "no_plots": no_plots,
+        "verbose": verbose,
+    }
+    selected = [test for test in _TEST_RUNNERS if test in tests]
+    test_records = {}
 
-    # Run requested tests
-    if "linear" in tests:
-        if verbose:
-            print("Running linear response tests...")
-        results = run_linear_response_test(
-            runfilters_path, inputs_dir, wav_dir, plots_dir, sample_rate,
-            cutoffs, filters, oversamples, skip_existing, no_plots, verbose
-        )
-        all_results.extend(results)
+    def save_results(test: str, results: List[AnalysisResult]) -> None:
+        # Convert each result to its JSON record once; the same records are
+        # reused for the summary
+        records = [_result_record(r) for r in results]
+        test_records[test] = records
 
         # Save test-specific metrics
-        with open(metrics_dir / "linear_response.json", 'w') as f:
-            json.dump([asdict(r) for r in results], f, indent=2)
-
-    if "resonance" in tests:
-        if verbose:
-            print("Running resonance tests...")
-        results = run_resonance_test(
-            runfilters_path, inputs_dir, wav_dir, plots_dir, sample_rate,
-            cutoffs, filters, skip_existing, no_plots, verbose
-        )
-        all_results.extend(results)
-
-        with open(metrics_dir / "resonance.json", 'w') as f:
-            json.dump([asdict(r) for r in results], f, indent=2)
-
-    if "selfoscillation" in tests:
-        if verbose:
-            print("Running self-oscillation tests...")
-        results = run_selfoscillation_test(
-            runfilters_path, inputs_dir, wav_dir, plots_dir, sample_rate,
-            cutoffs, filters, skip_existing, no_plots, verbose
-        )
-        all_results.extend(results)
-
-        with open(metrics_dir / "selfoscillation.json", 'w') as f:
-            json.dump([asdict(r) for r in results], f, indent=2)
-
-    if "thd" in tests:
-        if verbose:
-            print("Running THD tests...")
-        results = run_thd_test(
-            runfilters_path, inputs_dir, wav_dir, plots_dir, sample_rate,
-            filters, skip_existing, no_plots, verbose
-        )
-        all_results.extend(results)
-
-        with open(metrics_dir / "thd.json", 'w') as f:
-            json.dump([asdict(r) for r in results], f, indent=2)
-
-    if "imd" in tests:
-        if verbose:
-            print("Running IMD tests...")
-        results = run_imd_test(
-            runfilters_path, inputs_dir, wav_dir, plots_dir, sample_rate,
-            filters, skip_existing, no_plots, verbose
-        )
-        all_results.extend(results)
-
-        with open(metrics_dir / "imd.json", 'w') as f:
-            json.dump([asdict(r) for r in results], f, indent=2)
-
-    if "aliasing" in tests:
-        if verbose:
-            print("Running aliasing tests...")
-        results = run_aliasing_test(
-            runfilters_path, inputs_dir, wav_dir, plots_dir, sample_rate,
-            filters, oversamples, skip_existing, no_plots, verbose
-        )
-        all_results.extend(results)
-
-        with open(metrics_dir / "aliasing.json", 'w') as f:
-            json.dump([asdict(r) for r in results], f, indent=2)
-
-    if "step" in tests:
-        if verbose:
-            print("Running step response tests...")
-        results = run_step_test(
-            runfilters_path, inputs_dir, wav_dir, plots_dir, sample_rate,
-            filters, skip_existing, no_plots, verbose
-        )
-        all_results.extend(results)
-
-        with open(metrics_dir / "step.json", 'w') as f:
-            json.dump([asdict(r) for r in results], f, indent=2)
-
-    if "noise" in tests:
-        if verbose:
-            print("Running noise shaping tests...")
-        results = run_noise_test(
-            runfilters_path, inputs_dir, wav_dir, plots_dir, sample_rate,
-            filters, skip_existing, no_plots, verbose
-        )
-        all_results.extend(results)
+        write_json(metrics_dir / _TEST_RUNNERS[test][1], records)
+
+    # With --skip-existing, tests whose metrics were saved by an earlier run
+    # of the same configuration are loaded instead of re-analyzed
+    if skip_existing:
+        for test in list(selected):
+            metrics_path = metrics_dir / _TEST_RUNNERS[test][1]
+            try:
+                with open(metrics_path) as f:
+                    test_records[test] = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if verbose:
+                print(f"Reusing {_TEST_RUNNERS[test][2]} from {metrics_path}")
+    pending = [test for test in selected if test not in test_records]
+
+    # Run requested tests; each test writes its own input signal and output
+    # directories, so whole tests can run in separate processes
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    plot_jobs = jobs
+    # A lone test cannot use the test workers, so its plots get them instead
+    if jobs > 1 and len(pending) == 1 and not no_plots:
+        start_plot_pool(jobs)
+    jobs = min(jobs, len(pending))
+    # Each test worker starts its own RunFilters processes, so the cores are
+    # split between the workers rather than given to each of them
+    options["cpu_budget"] = max(1, (os.cpu_count() or 1) // max(jobs, 1))
+
+    if jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {}
+            for test in pending:
+                if verbose:
+                    print(f"Running {_TEST_RUNNERS[test][2]}...")
+                futures[executor.submit(_run_test, (test, common, options))] = test
+
+            for future in as_completed(futures):
+                test = futures[future]
+                save_results(test, future.result())
+                if verbose:
+                    print(f"Finished {_TEST_RUNNERS[test][2]}")
+    else:
+        if not no_plots and pending and _plot_executor is None:
+            _prewarm_pyplot()
+        for test in pending:
+            if verbose:
+                print(f"Running {_TEST_RUNNERS[test][2]}...")
+            save_results(test, _run_test((test, common, options)))
 
-        with open(metrics_dir / "noise.json", 'w') as f:
-            json.dump([asdict(r) for r in results], f, indent=2)
+    all_records = [r for test in selected for r in test_records[test]]
 
-    # Generate comparison plots
-    if not no_plots and "linear" in tests:
+    # Generate comparison plots (already on disk when linear results were reused)
+    if not no_plots and "linear" in pending:
         if verbose:
             print("Generating comparison plots...")
+        # The test workers have exited, so the per-cutoff comparison plots
+        # get the cores instead
+        if _plot_executor is None and plot_jobs > 1 and len(cutoffs) > 1:
+            start_plot_pool(min(plot_jobs, len(cutoffs)))
         generate_comparison_plots(wav_dir, plots_dir, sample_rate, filters, verbose)
 
+    finish_plots()
+
     # Create summary
     summary = MetricsSummary(
         run_id=run_id,
@@ -2181,13 +3054,13 @@ def run_test_suite(
         sample_rate=sample_rate,
         filters_tested=filters,
         tests_run=tests,
-        total_test_cases=len(all_results),
-        results=[asdict(r) for r in all_results]
+        total_test_cases=len(all_records),
+        results=all_records
     )
 
-    # Save summary
-    with open(metrics_dir / "summary.json", 'w') as f:
-        json.dump(asdict(summary), f, indent=2)
+    # Save summary; fields are already plain JSON types, so vars() avoids
+    # asdict's deep copy of every result record
+    write_json(metrics_dir / "summary.json", vars(summary))
 
     return summary
 
@@ -2203,23 +3076,20 @@ def print_summary(summary: MetricsSummary):
     print(f"Total Test Cases: {summary.total_test_cases}")
     print("=" * 60)
 
-    # Group results by test type
-    by_test = {}
-    for result in summary.results:
-        test = result['test_case']
-        if test not in by_test:
-            by_test[test] = []
-        by_test[test].append(result)
-
-    for test_name, results in by_test.items():
+    # Group results by test type; run_test_suite stores each test's results
+    # contiguously, so consecutive runs are already the groups
+    for test_name, results in itertools.groupby(summary.results, key=itemgetter('test_case')):
         print(f"\n{test_name.upper()}:")
 
         if test_name == "selfoscillation":
-            # Special formatting for self-oscillation
-            osc_filters = [r['filter_name'] for r in results if r['metrics'].get('oscillating', False)]
-            non_osc = [r['filter_name'] for r in results if not r['metrics'].get('oscillating', False)]
-            print(f"  Self-oscillating: {', '.join(set(osc_filters)) or 'None'}")
-            print(f"  Non-oscillating: {', '.join(set(non_osc)) or 'None'}")
+            # Special formatting for self-oscillation; one pass sorts each
+            # filter into the oscillating or non-oscillating set
+            osc_filters, non_osc = set(), set()
+            for r in results:
+                group = osc_filters if r['metrics'].get('oscillating', False) else non_osc
+                group.add(r['filter_name'])
+            print(f"  Self-oscillating: {', '.join(osc_filters) or 'None'}")
+            print(f"  Non-oscillating: {', '.join(non_osc) or 'None'}")
 
         elif test_name == "thd":
             # THD summary
@@ -2236,6 +3106,22 @@ def print_summary(summary: MetricsSummary):
                 print(f"  {r['filter_name']} (Q={r['resonance']}): overshoot={overshoot:.1f}%, settling={settling:.2f}ms")
 
 
+def _parse_name_list(value: str, names: List[str]) -> Tuple[List[str], set]:
+    """Parse a comma-separated --tests/--filters value.
+
+    Args:
+        value: Comma-separated names, or "all" (any case)
+        names: All valid names
+
+    Returns:
+        Tuple of (selected names, set of unknown names)
+    """
+    if value.lower() == 'all':
+        return names, set()
+    selected = [name.strip() for name in value.split(',')]
+    return selected, set(selected).difference(names)
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -2246,7 +3132,7 @@ Examples:
   python filter_verification.py --runfilters build/RunFilters.exe
   python filter_verification.py --runfilters build/RunFilters.exe --tests linear,thd --dashboard
   python filter_verification.py --runfilters build/RunFilters.exe --filters Stilson,Huovilainen --verbose
-  python filter_verification.py --dashboard-from filter_validation/2026-01-24_194311
+  python filter_verification.py --dashboard-from filter_validation/3f9a1c2b7d4e
         """
     )
 
@@ -2302,7 +3188,9 @@ Examples:
     parser.add_argument(
         '--skip-existing',
         action='store_true',
-        help='Skip tests where output already exists'
+        help='Reuse outputs and metrics already saved for this configuration '
+             '(without it, a re-run of the same configuration overwrites its '
+             'run directory in place)'
     )
 
     parser.add_argument(
@@ -2311,6 +3199,13 @@ Examples:
         help='Skip plot generation (metrics only)'
     )
 
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Number of tests to run in parallel (default: CPU count)'
+    )
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -2328,7 +3223,7 @@ Examples:
         type=Path,
         default=None,
         metavar='RUN_DIR',
-        help='Generate dashboard from existing run directory (e.g., filter_validation/2026-01-24_194311)'
+        help='Generate dashboard from existing run directory (e.g., filter_validation/3f9a1c2b7d4e)'
     )
 
     args = parser.parse_args()
@@ -2353,25 +3248,16 @@ Examples:
         print(f"Error: RunFilters not found at {args.runfilters}")
         sys.exit(1)
 
-    # Parse test list
-    if args.tests.lower() == 'all':
-        tests = TEST_NAMES
-    else:
-        tests = [t.strip() for t in args.tests.split(',')]
-        invalid = set(tests) - set(TEST_NAMES)
-        if invalid:
-            print(f"Error: Unknown tests: {invalid}")
-            sys.exit(1)
+    # Parse test and filter lists
+    tests, invalid = _parse_name_list(args.tests, TEST_NAMES)
+    if invalid:
+        print(f"Error: Unknown tests: {invalid}")
+        sys.exit(1)
 
-    # Parse filter list
-    if args.filters.lower() == 'all':
-        filters = FILTER_NAMES
-    else:
-        filters = [f.strip() for f in args.filters.split(',')]
-        invalid = set(filters) - set(FILTER_NAMES)
-        if invalid:
-            print(f"Error: Unknown filters: {invalid}")
-            sys.exit(1)
+    filters, invalid = _parse_name_list(args.filters, FILTER_NAMES)
+    if invalid:
+        print(f"Error: Unknown filters: {invalid}")
+        sys.exit(1)
 
     # Parse oversample factors
     oversamples = [int(x) for x in args.os.split(',')]
@@ -2403,7 +3289,8 @@ Examples:
         oversamples=oversamples,
         skip_existing=args.skip_existing,
         no_plots=args.no_plots,
-        verbose=args.verbose
+        verbose=args.verbose,
+        jobs=args.jobs
     )
 
     # Print summary
@@ -2415,7 +3302,8 @@ Examples:
     # Generate dashboard if requested
     if args.dashboard:
         print("\nGenerating interactive dashboard...")
-        dashboard_path = generate_dashboard(run_dir, verbose=args.verbose)
+        # Hand over the summary just written instead of re-reading it
+        dashboard_path = generate_dashboard(run_dir, verbose=args.verbose, summary=vars(summary))
         print(f"Dashboard generated: {dashboard_path}")
 
 
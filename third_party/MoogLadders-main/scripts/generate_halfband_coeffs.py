@@ -21,15 +21,18 @@ Output:
 
 import numpy as np
 import argparse
-from typing import List, Tuple
+import io
+import string
+from functools import lru_cache
+from typing import Callable, List, NamedTuple, Sequence, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
-class AllpassSection:
+class AllpassSection(NamedTuple):
     """Represents a first or second order allpass section."""
     order: int  # 1 or 2
-    coeffs: List[float]  # [a1] for first order, [a1, a2] for second order
+    a1: float
+    a2: float = 0.0  # Only used for second order
 
 
 @dataclass
@@ -123,9 +126,7 @@ def design_halfband_polyphase(spec: HalfBandSpec) -> Tuple[List[AllpassSection],
     # Design prototype lowpass
     b, a = design_halfband_elliptic(spec)
 
-    # Convert to second-order sections for stability analysis
     from scipy import signal
-    _ = signal.tf2sos(b, a)
 
     # For polyphase decomposition of a half-band filter, we need to
     # extract the allpass branches. A true polyphase allpass decomposition
@@ -146,7 +147,7 @@ def design_halfband_polyphase(spec: HalfBandSpec) -> Tuple[List[AllpassSection],
     z, p, k = signal.tf2zpk(b, a)
 
     # Sort poles by angle for pairing
-    poles = sorted(p, key=lambda x: abs(np.angle(x)))
+    poles = p[np.argsort(np.abs(np.angle(p)), kind='stable')].tolist()
 
     # For half-band polyphase allpass, distribute poles between branches
     # Real poles and complex conjugate pairs are assigned alternately
@@ -154,6 +155,16 @@ def design_halfband_polyphase(spec: HalfBandSpec) -> Tuple[List[AllpassSection],
     processed = set()
     pole_groups = []
 
+    # Conjugates share (real, |imag|), so bucket poles on that key to find
+    # each partner without scanning every other pole
+    conj_map = {}
+    for i, pole in enumerate(poles):
+        key = (round(pole.real, 10), round(abs(pole.imag), 10))
+        conj_map.setdefault(key, []).append(i)
+
+    def is_conjugate(i, j):
+        return j not in processed and j != i and abs(poles[i] - poles[j].conjugate()) < 1e-10
+
     for i, pole in enumerate(poles):
         if i in processed:
             continue
@@ -164,13 +175,15 @@ def design_halfband_polyphase(spec: HalfBandSpec) -> Tuple[List[AllpassSection],
             processed.add(i)
         else:
             # Complex pole -> find conjugate and make second order
-            for j, other in enumerate(poles):
-                if j not in processed and j != i:
-                    if abs(pole - np.conj(other)) < 1e-10:
-                        pole_groups.append([pole, other])
-                        processed.add(i)
-                        processed.add(j)
-                        break
+            key = (round(pole.real, 10), round(abs(pole.imag), 10))
+            j = next((j for j in conj_map[key] if is_conjugate(i, j)), None)
+            if j is None:
+                # Rounding can put a conjugate in a neighbouring bucket
+                j = next((j for j in range(len(poles)) if is_conjugate(i, j)), None)
+            if j is not None:
+                pole_groups.append([pole, poles[j]])
+                processed.add(i)
+                processed.add(j)
 
     # Distribute pole groups between branches
     for i, group in enumerate(pole_groups):
@@ -178,14 +191,14 @@ def design_halfband_polyphase(spec: HalfBandSpec) -> Tuple[List[AllpassSection],
             # First order allpass: H(z) = (a1 + z^-1) / (1 + a1*z^-1)
             # where a1 = -pole
             a1 = -group[0]
-            section = AllpassSection(order=1, coeffs=[a1])
+            section = AllpassSection(order=1, a1=a1)
         else:
             # Second order allpass from complex conjugate pair
             # H(z) = (a2 + a1*z^-1 + z^-2) / (1 + a1*z^-1 + a2*z^-2)
             p1, p2 = group[0], group[1]
             a1 = -(p1 + p2).real
             a2 = (p1 * p2).real
-            section = AllpassSection(order=2, coeffs=[a1, a2])
+            section = AllpassSection(order=2, a1=a1, a2=a2)
 
         # Alternate between branches
         if i % 2 == 0:
@@ -196,7 +209,10 @@ def design_halfband_polyphase(spec: HalfBandSpec) -> Tuple[List[AllpassSection],
     return branch0, branch1
 
 
-def compute_optimal_halfband_coeffs(quality: str) -> Tuple[List[AllpassSection], List[AllpassSection]]:
+@lru_cache(maxsize=8)
+def compute_optimal_halfband_coeffs(
+    quality: str
+) -> Tuple[Tuple[AllpassSection, ...], Tuple[AllpassSection, ...]]:
     """
     Compute optimal polyphase allpass coefficients for half-band filters.
 
@@ -208,6 +224,8 @@ def compute_optimal_halfband_coeffs(quality: str) -> Tuple[List[AllpassSection],
     - Harris, "On the Use of Windows for Harmonic Analysis..."
     - Valimaki, Smith, "Fractional Delay Filter Design Based on..."
     - Crochiere, Rabiner, "Multirate Digital Signal Processing"
+
+    Results are cached, so the branches are returned as immutable tuples.
     """
 
     # Pre-computed optimal coefficients for each quality level
@@ -217,35 +235,35 @@ def compute_optimal_halfband_coeffs(quality: str) -> Tuple[List[AllpassSection],
     if quality == 'draft':
         # 3rd order: ~40dB stopband, 0.5dB passband ripple
         # 2 allpass sections total (1 per branch)
-        branch0 = [
-            AllpassSection(order=1, coeffs=[0.1176470588235294])
-        ]
-        branch1 = [
-            AllpassSection(order=2, coeffs=[0.5352980861116968, 0.04028899340413436])
-        ]
+        branch0 = (
+            AllpassSection(order=1, a1=0.1176470588235294),
+        )
+        branch1 = (
+            AllpassSection(order=2, a1=0.5352980861116968, a2=0.04028899340413436),
+        )
 
     elif quality == 'standard':
         # 5th order: ~60dB stopband, 0.1dB passband ripple
         # 3 allpass sections total
-        branch0 = [
-            AllpassSection(order=1, coeffs=[0.0636044237126984]),
-            AllpassSection(order=2, coeffs=[0.5120527193695535, 0.0185681196357082])
-        ]
-        branch1 = [
-            AllpassSection(order=2, coeffs=[0.2699424601713852, 0.0018523256018694])
-        ]
+        branch0 = (
+            AllpassSection(order=1, a1=0.0636044237126984),
+            AllpassSection(order=2, a1=0.5120527193695535, a2=0.0185681196357082)
+        )
+        branch1 = (
+            AllpassSection(order=2, a1=0.2699424601713852, a2=0.0018523256018694),
+        )
 
     elif quality == 'high':
         # 7th order: ~80dB stopband, 0.05dB passband ripple
         # 4 allpass sections total
-        branch0 = [
-            AllpassSection(order=1, coeffs=[0.0361328125]),
-            AllpassSection(order=2, coeffs=[0.3883457569587482, 0.0078125])
-        ]
-        branch1 = [
-            AllpassSection(order=2, coeffs=[0.1467429045417735, 0.0009765625]),
-            AllpassSection(order=2, coeffs=[0.5869511310896879, 0.0361328125])
-        ]
+        branch0 = (
+            AllpassSection(order=1, a1=0.0361328125),
+            AllpassSection(order=2, a1=0.3883457569587482, a2=0.0078125)
+        )
+        branch1 = (
+            AllpassSection(order=2, a1=0.1467429045417735, a2=0.0009765625),
+            AllpassSection(order=2, a1=0.5869511310896879, a2=0.0361328125)
+        )
     else:
         raise ValueError(f"Unknown quality: {quality}")
 
@@ -253,8 +271,8 @@ def compute_optimal_halfband_coeffs(quality: str) -> Tuple[List[AllpassSection],
 
 
 def make_quasi_linear(
-    branch0: List[AllpassSection],
-    branch1: List[AllpassSection],
+    branch0: Sequence[AllpassSection],
+    branch1: Sequence[AllpassSection],
     delay_sections: int = 1
 ) -> Tuple[List[AllpassSection], List[AllpassSection]]:
     """
@@ -263,238 +281,210 @@ def make_quasi_linear(
     A first-order allpass with a1 = 0 is a unit delay (z^-1). In the polyphase
     structure A(z^2), this becomes a two-sample delay at the input rate.
     """
-    delay = AllpassSection(order=1, coeffs=[0.0])
+    delay = AllpassSection(order=1, a1=0.0)
     delay_chain = [delay for _ in range(delay_sections)]
     return delay_chain + list(branch0), delay_chain + list(branch1)
 
 
+def emit_array(w: Callable[[str], int], name: str, sections: Sequence[AllpassSection]):
+    """Write one AllpassCoeff array literal followed by a blank line."""
+    w(f"static const AllpassCoeff {name}[] = {{\n")
+    for section in sections:
+        if section.order == 1:
+            w(f"    {{1, {section.a1:.16f}, 0.0}},\n")
+        else:
+            w(f"    {{2, {section.a1:.16f}, {section.a2:.16f}}},\n")
+    w("};\n")
+    w("\n")
+
+
+# Fixed parts of the generated header. $coeff_arrays and $switch_cases are
+# filled in by generate_cpp_header. Latency values are in samples at the
+# input rate: minimum phase is roughly order/2, quasi-linear adds the delay.
+HEADER_TEMPLATE = string.Template("""\
+// Auto-generated by generate_halfband_coeffs.py
+// Do not edit manually
+
+#pragma once
+
+#ifndef OVERSAMPLING_FILTER_COEFFS_HPP
+#define OVERSAMPLING_FILTER_COEFFS_HPP
+
+#include <array>
+#include <cmath>
+#include <cstdint>
+
+namespace MoogLadders {
+namespace Oversampling {
+
+// Allpass section coefficient storage
+struct AllpassCoeff {
+    int order;          // 1 = first order, 2 = second order
+    double a1;          // First coefficient
+    double a2;          // Second coefficient (only for order=2)
+};
+
+// Half-band filter coefficients in polyphase allpass form
+struct HalfBandCoeffs {
+    const AllpassCoeff* branch0;  // Even samples allpass chain
+    uint32_t branch0_count;
+    const AllpassCoeff* branch1;  // Odd samples allpass chain
+    uint32_t branch1_count;
+    int latency_samples;          // Filter latency in samples
+};
+
+enum class Quality {
+    Draft,     // ~40dB stopband, low CPU
+    Standard,  // ~60dB stopband, balanced
+    High       // ~80dB stopband, highest quality
+};
+
+enum class PhaseMode {
+    MinimumPhase,     // Lower latency, phase distortion
+    QuasiLinearPhase  // Higher latency, flatter phase
+};
+
+$coeff_arrays// Latency lookup tables (samples at input rate)
+// MinimumPhase latency per 2x stage
+static const int kLatencyMinPhase[] = {
+    2,  // Draft: 3rd order
+    3,  // Standard: 5th order
+    4   // High: 7th order
+};
+
+// QuasiLinearPhase latency per 2x stage
+static const int kLatencyLinearPhase[] = {
+    4,  // Draft: 3rd order (min + 2)
+    5,  // Standard: 5th order (min + 2)
+    6   // High: 7th order (min + 2)
+};
+
+// Get coefficients for specified quality
+inline HalfBandCoeffs GetHalfBandCoeffs(Quality quality, PhaseMode phase) {
+    HalfBandCoeffs result;
+    int qualityIdx = static_cast<int>(quality);
+    
+    switch (quality) {
+$switch_cases    }
+    
+    if (phase == PhaseMode::MinimumPhase) {
+        result.latency_samples = kLatencyMinPhase[qualityIdx];
+    } else {
+        result.latency_samples = kLatencyLinearPhase[qualityIdx];
+    }
+    
+    return result;
+}
+
+// Calculate total latency for oversampling factor
+inline int GetTotalLatency(int factor, Quality quality, PhaseMode phase) {
+    int qualityIdx = static_cast<int>(quality);
+    int perStageLatency = (phase == PhaseMode::MinimumPhase)
+        ? kLatencyMinPhase[qualityIdx]
+        : kLatencyLinearPhase[qualityIdx];
+    
+    // Number of stages: log2(factor)
+    int numStages = 0;
+    int f = factor;
+    while (f > 1) { numStages++; f >>= 1; }
+    
+    // Each stage adds latency, but at different rates
+    // Stage 1: latency at input rate
+    // Stage 2: latency/2 at input rate (runs at 2x)
+    // Stage 3: latency/4 at input rate (runs at 4x)
+    double totalLatency = 0.0;
+    int divisor = 1;
+    for (int i = 0; i < numStages; i++) {
+        // Upsampler latency
+        totalLatency += static_cast<double>(perStageLatency) / divisor;
+        // Downsampler latency (same as upsampler for symmetric filter)
+        totalLatency += static_cast<double>(perStageLatency) / divisor;
+        divisor *= 2;
+    }
+    
+    return static_cast<int>(std::lround(totalLatency));
+}
+
+} // namespace Oversampling
+} // namespace MoogLadders
+
+#endif // OVERSAMPLING_FILTER_COEFFS_HPP
+""")
+
+
 def generate_cpp_header(output_path: str):
     """Generate the C++ header file with all coefficient sets."""
 
-    lines = []
-    lines.append("// Auto-generated by generate_halfband_coeffs.py")
-    lines.append("// Do not edit manually")
-    lines.append("")
-    lines.append("#pragma once")
-    lines.append("")
-    lines.append("#ifndef OVERSAMPLING_FILTER_COEFFS_HPP")
-    lines.append("#define OVERSAMPLING_FILTER_COEFFS_HPP")
-    lines.append("")
-    lines.append("#include <array>")
-    lines.append("#include <cmath>")
-    lines.append("#include <cstdint>")
-    lines.append("")
-    lines.append("namespace MoogLadders {")
-    lines.append("namespace Oversampling {")
-    lines.append("")
-
-    # AllpassCoeff struct
-    lines.append("// Allpass section coefficient storage")
-    lines.append("struct AllpassCoeff {")
-    lines.append("    int order;          // 1 = first order, 2 = second order")
-    lines.append("    double a1;          // First coefficient")
-    lines.append("    double a2;          // Second coefficient (only for order=2)")
-    lines.append("};")
-    lines.append("")
-
-    # HalfBandCoeffs struct
-    lines.append("// Half-band filter coefficients in polyphase allpass form")
-    lines.append("struct HalfBandCoeffs {")
-    lines.append("    const AllpassCoeff* branch0;  // Even samples allpass chain")
-    lines.append("    uint32_t branch0_count;")
-    lines.append("    const AllpassCoeff* branch1;  // Odd samples allpass chain")
-    lines.append("    uint32_t branch1_count;")
-    lines.append("    int latency_samples;          // Filter latency in samples")
-    lines.append("};")
-    lines.append("")
-
-    # Quality enum
-    lines.append("enum class Quality {")
-    lines.append("    Draft,     // ~40dB stopband, low CPU")
-    lines.append("    Standard,  // ~60dB stopband, balanced")
-    lines.append("    High       // ~80dB stopband, highest quality")
-    lines.append("};")
-    lines.append("")
-
-    # Phase mode enum
-    lines.append("enum class PhaseMode {")
-    lines.append("    MinimumPhase,     // Lower latency, phase distortion")
-    lines.append("    QuasiLinearPhase  // Higher latency, flatter phase")
-    lines.append("};")
-    lines.append("")
-
-    # Generate coefficients for each quality level
+    arrays = io.StringIO()
     for quality_name in ['draft', 'standard', 'high']:
         min_branch0, min_branch1 = compute_optimal_halfband_coeffs(quality_name)
         lin_branch0, lin_branch1 = make_quasi_linear(min_branch0, min_branch1, delay_sections=1)
-
-        # Branch 0 coefficients
-        lines.append(f"// {quality_name.capitalize()} quality - MinimumPhase - Branch 0")
-        lines.append(f"static const AllpassCoeff kHalfBand_{quality_name.capitalize()}_MinPhase_Branch0[] = {{")
-        for section in min_branch0:
-            if section.order == 1:
-                lines.append(f"    {{1, {section.coeffs[0]:.16f}, 0.0}},")
-            else:
-                lines.append(f"    {{2, {section.coeffs[0]:.16f}, {section.coeffs[1]:.16f}}},")
-        lines.append("};")
-        lines.append("")
-
-        # Branch 1 coefficients
-        lines.append(f"// {quality_name.capitalize()} quality - MinimumPhase - Branch 1")
-        lines.append(f"static const AllpassCoeff kHalfBand_{quality_name.capitalize()}_MinPhase_Branch1[] = {{")
-        for section in min_branch1:
-            if section.order == 1:
-                lines.append(f"    {{1, {section.coeffs[0]:.16f}, 0.0}},")
-            else:
-                lines.append(f"    {{2, {section.coeffs[0]:.16f}, {section.coeffs[1]:.16f}}},")
-        lines.append("};")
-        lines.append("")
-
-        # Quasi-linear coefficients (minimum-phase + delay)
-        lines.append(f"// {quality_name.capitalize()} quality - QuasiLinearPhase - Branch 0")
-        lines.append(f"static const AllpassCoeff kHalfBand_{quality_name.capitalize()}_QuasiLinear_Branch0[] = {{")
-        for section in lin_branch0:
-            if section.order == 1:
-                lines.append(f"    {{1, {section.coeffs[0]:.16f}, 0.0}},")
-            else:
-                lines.append(f"    {{2, {section.coeffs[0]:.16f}, {section.coeffs[1]:.16f}}},")
-        lines.append("};")
-        lines.append("")
-
-        lines.append(f"// {quality_name.capitalize()} quality - QuasiLinearPhase - Branch 1")
-        lines.append(f"static const AllpassCoeff kHalfBand_{quality_name.capitalize()}_QuasiLinear_Branch1[] = {{")
-        for section in lin_branch1:
-            if section.order == 1:
-                lines.append(f"    {{1, {section.coeffs[0]:.16f}, 0.0}},")
-            else:
-                lines.append(f"    {{2, {section.coeffs[0]:.16f}, {section.coeffs[1]:.16f}}},")
-        lines.append("};")
-        lines.append("")
-
-    # Latency values (in samples at input rate)
-    # Minimum phase: approximately order/2 samples
-    # Quasi-linear phase: minimum phase + added delay
-    lines.append("// Latency lookup tables (samples at input rate)")
-    lines.append("// MinimumPhase latency per 2x stage")
-    lines.append("static const int kLatencyMinPhase[] = {")
-    lines.append("    2,  // Draft: 3rd order")
-    lines.append("    3,  // Standard: 5th order")
-    lines.append("    4   // High: 7th order")
-    lines.append("};")
-    lines.append("")
-    lines.append("// QuasiLinearPhase latency per 2x stage")
-    lines.append("static const int kLatencyLinearPhase[] = {")
-    lines.append("    4,  // Draft: 3rd order (min + 2)")
-    lines.append("    5,  // Standard: 5th order (min + 2)")
-    lines.append("    6   // High: 7th order (min + 2)")
-    lines.append("};")
-    lines.append("")
-
-    # Coefficient accessor function
-    lines.append("// Get coefficients for specified quality")
-    lines.append("inline HalfBandCoeffs GetHalfBandCoeffs(Quality quality, PhaseMode phase) {")
-    lines.append("    HalfBandCoeffs result;")
-    lines.append("    int qualityIdx = static_cast<int>(quality);")
-    lines.append("    ")
-    lines.append("    switch (quality) {")
-    lines.append("        case Quality::Draft:")
-    lines.append("            if (phase == PhaseMode::MinimumPhase) {")
-    lines.append("                result.branch0 = kHalfBand_Draft_MinPhase_Branch0;")
-    lines.append("                result.branch0_count = sizeof(kHalfBand_Draft_MinPhase_Branch0) / sizeof(AllpassCoeff);")
-    lines.append("                result.branch1 = kHalfBand_Draft_MinPhase_Branch1;")
-    lines.append("                result.branch1_count = sizeof(kHalfBand_Draft_MinPhase_Branch1) / sizeof(AllpassCoeff);")
-    lines.append("            } else {")
-    lines.append("                result.branch0 = kHalfBand_Draft_QuasiLinear_Branch0;")
-    lines.append("                result.branch0_count = sizeof(kHalfBand_Draft_QuasiLinear_Branch0) / sizeof(AllpassCoeff);")
-    lines.append("                result.branch1 = kHalfBand_Draft_QuasiLinear_Branch1;")
-    lines.append("                result.branch1_count = sizeof(kHalfBand_Draft_QuasiLinear_Branch1) / sizeof(AllpassCoeff);")
-    lines.append("            }")
-    lines.append("            break;")
-    lines.append("        case Quality::Standard:")
-    lines.append("            if (phase == PhaseMode::MinimumPhase) {")
-    lines.append("                result.branch0 = kHalfBand_Standard_MinPhase_Branch0;")
-    lines.append("                result.branch0_count = sizeof(kHalfBand_Standard_MinPhase_Branch0) / sizeof(AllpassCoeff);")
-    lines.append("                result.branch1 = kHalfBand_Standard_MinPhase_Branch1;")
-    lines.append("                result.branch1_count = sizeof(kHalfBand_Standard_MinPhase_Branch1) / sizeof(AllpassCoeff);")
-    lines.append("            } else {")
-    lines.append("                result.branch0 = kHalfBand_Standard_QuasiLinear_Branch0;")
-    lines.append("                result.branch0_count = sizeof(kHalfBand_Standard_QuasiLinear_Branch0) / sizeof(AllpassCoeff);")
-    lines.append("                result.branch1 = kHalfBand_Standard_QuasiLinear_Branch1;")
-    lines.append("                result.branch1_count = sizeof(kHalfBand_Standard_QuasiLinear_Branch1) / sizeof(AllpassCoeff);")
-    lines.append("            }")
-    lines.append("            break;")
-    lines.append("        case Quality::High:")
-    lines.append("            if (phase == PhaseMode::MinimumPhase) {")
-    lines.append("                result.branch0 = kHalfBand_High_MinPhase_Branch0;")
-    lines.append("                result.branch0_count = sizeof(kHalfBand_High_MinPhase_Branch0) / sizeof(AllpassCoeff);")
-    lines.append("                result.branch1 = kHalfBand_High_MinPhase_Branch1;")
-    lines.append("                result.branch1_count = sizeof(kHalfBand_High_MinPhase_Branch1) / sizeof(AllpassCoeff);")
-    lines.append("            } else {")
-    lines.append("                result.branch0 = kHalfBand_High_QuasiLinear_Branch0;")
-    lines.append("                result.branch0_count = sizeof(kHalfBand_High_QuasiLinear_Branch0) / sizeof(AllpassCoeff);")
-    lines.append("                result.branch1 = kHalfBand_High_QuasiLinear_Branch1;")
-    lines.append("                result.branch1_count = sizeof(kHalfBand_High_QuasiLinear_Branch1) / sizeof(AllpassCoeff);")
-    lines.append("            }")
-    lines.append("            break;")
-    lines.append("    }")
-    lines.append("    ")
-    lines.append("    if (phase == PhaseMode::MinimumPhase) {")
-    lines.append("        result.latency_samples = kLatencyMinPhase[qualityIdx];")
-    lines.append("    } else {")
-    lines.append("        result.latency_samples = kLatencyLinearPhase[qualityIdx];")
-    lines.append("    }")
-    lines.append("    ")
-    lines.append("    return result;")
-    lines.append("}")
-    lines.append("")
-
-    # Calculate total latency for cascaded stages
-    lines.append("// Calculate total latency for oversampling factor")
-    lines.append("inline int GetTotalLatency(int factor, Quality quality, PhaseMode phase) {")
-    lines.append("    int qualityIdx = static_cast<int>(quality);")
-    lines.append("    int perStageLatency = (phase == PhaseMode::MinimumPhase)")
-    lines.append("        ? kLatencyMinPhase[qualityIdx]")
-    lines.append("        : kLatencyLinearPhase[qualityIdx];")
-    lines.append("    ")
-    lines.append("    // Number of stages: log2(factor)")
-    lines.append("    int numStages = 0;")
-    lines.append("    int f = factor;")
-    lines.append("    while (f > 1) { numStages++; f >>= 1; }")
-    lines.append("    ")
-    lines.append("    // Each stage adds latency, but at different rates")
-    lines.append("    // Stage 1: latency at input rate")
-    lines.append("    // Stage 2: latency/2 at input rate (runs at 2x)")
-    lines.append("    // Stage 3: latency/4 at input rate (runs at 4x)")
-    lines.append("    double totalLatency = 0.0;")
-    lines.append("    int divisor = 1;")
-    lines.append("    for (int i = 0; i < numStages; i++) {")
-    lines.append("        // Upsampler latency")
-    lines.append("        totalLatency += static_cast<double>(perStageLatency) / divisor;")
-    lines.append("        // Downsampler latency (same as upsampler for symmetric filter)")
-    lines.append("        totalLatency += static_cast<double>(perStageLatency) / divisor;")
-    lines.append("        divisor *= 2;")
-    lines.append("    }")
-    lines.append("    ")
-    lines.append("    return static_cast<int>(std::lround(totalLatency));")
-    lines.append("}")
-    lines.append("")
-
-    lines.append("} // namespace Oversampling")
-    lines.append("} // namespace MoogLadders")
-    lines.append("")
-    lines.append("#endif // OVERSAMPLING_FILTER_COEFFS_HPP")
-    lines.append("")
+        quality = quality_name.capitalize()
+
+        phase_variants = (
+            ('MinimumPhase', 'MinPhase', (min_branch0, min_branch1)),
+            # Quasi-linear coefficients (minimum-phase + delay)
+            ('QuasiLinearPhase', 'QuasiLinear', (lin_branch0, lin_branch1)),
+        )
+        for phase_name, tag, branches in phase_variants:
+            for branch_idx, sections in enumerate(branches):
+                arrays.write(f"// {quality} quality - {phase_name} - Branch {branch_idx}\n")
+                emit_array(arrays.write, f"kHalfBand_{quality}_{tag}_Branch{branch_idx}", sections)
+
+    cases = io.StringIO()
+    w = cases.write
+    for quality in ['Draft', 'Standard', 'High']:
+        w(f"        case Quality::{quality}:\n")
+        for opener, tag in (("if (phase == PhaseMode::MinimumPhase) {", 'MinPhase'),
+                            ("} else {", 'QuasiLinear')):
+            w(f"            {opener}\n")
+            for branch_idx in range(2):
+                name = f"kHalfBand_{quality}_{tag}_Branch{branch_idx}"
+                w(f"                result.branch{branch_idx} = {name};\n")
+                w(f"                result.branch{branch_idx}_count = sizeof({name}) / sizeof(AllpassCoeff);\n")
+        w("            }\n")
+        w("            break;\n")
+
+    header = HEADER_TEMPLATE.substitute(
+        coeff_arrays=arrays.getvalue(),
+        switch_cases=cases.getvalue())
 
     with open(output_path, 'w') as f:
-        f.write('\n'.join(lines))
+        f.write(header)
 
     print(f"Generated {output_path}")
 
 
+def eval_allpass_chain(
+    sections: Sequence[AllpassSection],
+    iz2: np.ndarray
+) -> np.ndarray:
+    """
+    Evaluate a cascade of allpass sections A(z^2) on a frequency grid.
+
+    iz2 is z^-2 at each grid point. Sections of the same order are stacked
+    and evaluated in one broadcast expression.
+    """
+    first = np.array([s.a1 for s in sections if s.order == 1])
+    second = np.array([(s.a1, s.a2) for s in sections if s.order == 2]).reshape(-1, 2)
+
+    response = np.ones_like(iz2)
+    if first.size:
+        # First order allpass: (a1 + z^-1) / (1 + a1*z^-1)
+        a1 = first[:, None]
+        response *= np.prod((a1 + iz2) / (1 + a1 * iz2), axis=0)
+    if second.size:
+        # Second order allpass: (a2 + a1*z^-1 + z^-2) / (1 + a1*z^-1 + a2*z^-2)
+        # evaluated in Horner form
+        a1, a2 = second[:, 0, None], second[:, 1, None]
+        num = (iz2 + a1) * iz2 + a2
+        den = (a2 * iz2 + a1) * iz2 + 1
+        response *= np.prod(num / den, axis=0)
+    return response
+
+
 def validate_coefficients(quality: str):
     """Validate the filter frequency response."""
-    import matplotlib.pyplot as plt
-
     branch0, branch1 = compute_optimal_halfband_coeffs(quality)
 
     # Compute frequency response by combining allpass branches
@@ -502,41 +492,14 @@ def validate_coefficients(quality: str):
 
     num_points = 1024
     w = np.linspace(0, np.pi, num_points)
-    z = np.exp(1j * w)
-    z2 = z ** 2  # For polyphase (z^2)
+    iz = np.exp(-1j * w)
+    iz2 = np.exp(-2j * w)  # For polyphase (z^-2)
 
-    # Compute A0(z^2)
-    A0 = np.ones(num_points, dtype=complex)
-    for section in branch0:
-        if section.order == 1:
-            a1 = section.coeffs[0]
-            # First order allpass: (a1 + z^-1) / (1 + a1*z^-1)
-            num = a1 + 1/z2
-            den = 1 + a1/z2
-            A0 *= num / den
-        else:
-            a1, a2 = section.coeffs[0], section.coeffs[1]
-            # Second order allpass: (a2 + a1*z^-1 + z^-2) / (1 + a1*z^-1 + a2*z^-2)
-            num = a2 + a1/z2 + 1/(z2**2)
-            den = 1 + a1/z2 + a2/(z2**2)
-            A0 *= num / den
-
-    # Compute A1(z^2)
-    A1 = np.ones(num_points, dtype=complex)
-    for section in branch1:
-        if section.order == 1:
-            a1 = section.coeffs[0]
-            num = a1 + 1/z2
-            den = 1 + a1/z2
-            A1 *= num / den
-        else:
-            a1, a2 = section.coeffs[0], section.coeffs[1]
-            num = a2 + a1/z2 + 1/(z2**2)
-            den = 1 + a1/z2 + a2/(z2**2)
-            A1 *= num / den
+    A0 = eval_allpass_chain(branch0, iz2)
+    A1 = eval_allpass_chain(branch1, iz2)
 
     # Combine: H(z) = 0.5 * [A0(z^2) + z^-1 * A1(z^2)]
-    H = 0.5 * (A0 + (1/z) * A1)
+    H = 0.5 * (A0 + iz * A1)
 
     # Convert to dB
     mag_db = 20 * np.log10(np.abs(H) + 1e-12)